@@ -8,16 +8,41 @@ When energy sources are provided, calculates real clean_gen scores based on
 proximity to actual renewable energy projects. Otherwise uses mock data.
 """
 
-from typing import List, Optional
+from collections import defaultdict
+import copy
+from typing import Dict, List, Optional, Sequence, Tuple
 from models import GridNode, GridNodeCoordinates, NearbyProject, TransmissionLine
 import logging
+import numpy as np
+from scoring_utils import (
+    BATCH_MIN_PAIRS,
+    calculate_clean_gen_score,
+    calculate_clean_gen_scores_batch,
+    calculate_transmission_score,
+    calculate_transmission_scores_batch,
+    estimate_normalization_factor,
+    estimate_transmission_normalization_factor
+)
 
+# Pass log arguments %-style (not f-strings) so messages are only formatted
+# when emitted, and guard per-item logging in loops with logger.isEnabledFor()
 logger = logging.getLogger(__name__)
 
 
-def generate_mock_grid_nodes() -> List[GridNode]:
+def generate_mock_grid_nodes() -> Tuple[GridNode, ...]:
     """
-    Generate 15 mock grid nodes across major US regions.
+    Get the mock grid nodes (built once at import, see _MOCK_NODES).
+    
+    Returned as an immutable tuple so the single instance can be shared
+    between callers without defensive copies. Callers that need to change
+    a node should model_copy() it themselves.
+    """
+    return _MOCK_NODES
+
+
+def build_mock_grid_nodes() -> Tuple[GridNode, ...]:
+    """
+    Build 15 mock grid nodes across major US regions.
     
     Scores reflect realistic characteristics:
     - Pacific NW: High clean gen (hydro/wind), good transmission
@@ -27,7 +52,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
     - Southeast: Lower clean gen, moderate reliability
     """
     
-    nodes = [
+    nodes = (
         # Pacific Northwest (1-2)
         GridNode(
             id=1,
@@ -39,7 +64,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Pacific Northwest",
             state="OR",
             balancing_authority="BPA",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Columbia Gorge Wind Farm",
                     distance_km=48,
@@ -53,17 +78,17 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=450,
                     project_type="hydro",
                     status="under_construction"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="BPA-500-01",
                     distance_km=12,
                     voltage_kv=500,
                     capacity_available_mw=350,
                     upgrade_cost_estimate_million=2.1
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=2,
@@ -75,23 +100,23 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Pacific Northwest",
             state="WA",
             balancing_authority="BPA",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Puget Sound Offshore Wind",
                     distance_km=65,
                     capacity_mw=800,
                     project_type="wind",
                     status="planned"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="BPA-500-02",
                     distance_km=8,
                     voltage_kv=500,
                     capacity_available_mw=420
-                )
-            ]
+                ),
+            )
         ),
         
         # California (3-4)
@@ -105,7 +130,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="California",
             state="CA",
             balancing_authority="CAISO",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Sierra Solar Array",
                     distance_km=32,
@@ -119,17 +144,17 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=1200,
                     project_type="hydro",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="CAISO-500-12",
                     distance_km=18,
                     voltage_kv=500,
                     capacity_available_mw=180,
                     upgrade_cost_estimate_million=4.5
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=4,
@@ -141,7 +166,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="California",
             state="CA",
             balancing_authority="CAISO",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Central Valley Solar Farm",
                     distance_km=22,
@@ -155,8 +180,8 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=2200,
                     project_type="nuclear",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         
         # Texas (5-7)
@@ -170,7 +195,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Texas",
             state="TX",
             balancing_authority="ERCOT",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Panhandle Wind Complex",
                     distance_km=18,
@@ -184,16 +209,16 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=300,
                     project_type="solar",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="ERCOT-345-23",
                     distance_km=15,
                     voltage_kv=345,
                     capacity_available_mw=520
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=6,
@@ -205,23 +230,23 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Texas",
             state="TX",
             balancing_authority="ERCOT",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Permian Basin Solar",
                     distance_km=28,
                     capacity_mw=850,
                     project_type="solar",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="ERCOT-500-45",
                     distance_km=10,
                     voltage_kv=500,
                     capacity_available_mw=680
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=7,
@@ -246,7 +271,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Midwest",
             state="IA",
             balancing_authority="MISO",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Iowa Wind Belt",
                     distance_km=25,
@@ -260,16 +285,16 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=200,
                     project_type="solar",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="MISO-345-67",
                     distance_km=14,
                     voltage_kv=345,
                     capacity_available_mw=410
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=9,
@@ -281,7 +306,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Midwest",
             state="IL",
             balancing_authority="MISO",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Illinois Wind Farm",
                     distance_km=45,
@@ -295,8 +320,8 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=2300,
                     project_type="nuclear",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=10,
@@ -321,7 +346,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Southeast",
             state="GA",
             balancing_authority="Southern Company",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Georgia Solar Initiative",
                     distance_km=38,
@@ -335,8 +360,8 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=2200,
                     project_type="nuclear",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=12,
@@ -361,7 +386,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Mountain West",
             state="CO",
             balancing_authority="WAPA",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Front Range Wind",
                     distance_km=55,
@@ -375,16 +400,16 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=400,
                     project_type="solar",
                     status="under_construction"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="WAPA-345-89",
                     distance_km=22,
                     voltage_kv=345,
                     capacity_available_mw=380
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=14,
@@ -409,7 +434,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Northeast",
             state="NY",
             balancing_authority="NYISO",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Lake Ontario Offshore Wind",
                     distance_km=72,
@@ -423,16 +448,16 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=800,
                     project_type="hydro",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="NYISO-345-12",
                     distance_km=16,
                     voltage_kv=345,
                     capacity_available_mw=290
-                )
-            ]
+                ),
+            )
         ),
         
         # Southwest (16-20)
@@ -446,7 +471,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Southwest",
             state="AZ",
             balancing_authority="WECC",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Phoenix Solar Complex",
                     distance_km=25,
@@ -460,16 +485,16 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=3900,
                     project_type="nuclear",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="WECC-500-34",
                     distance_km=18,
                     voltage_kv=500,
                     capacity_available_mw=580
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=17,
@@ -481,7 +506,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Southwest",
             state="NV",
             balancing_authority="WECC",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Mojave Desert Solar Array",
                     distance_km=45,
@@ -495,16 +520,16 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=2080,
                     project_type="hydro",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="WECC-500-56",
                     distance_km=12,
                     voltage_kv=500,
                     capacity_available_mw=620
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=18,
@@ -516,15 +541,15 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Southwest",
             state="UT",
             balancing_authority="WECC",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Wasatch Wind Farm",
                     distance_km=38,
                     capacity_mw=450,
                     project_type="wind",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=19,
@@ -536,23 +561,23 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Southwest",
             state="AZ",
             balancing_authority="WECC",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Tucson Solar Park",
                     distance_km=28,
                     capacity_mw=600,
                     project_type="solar",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="WECC-345-78",
                     distance_km=15,
                     voltage_kv=345,
                     capacity_available_mw=440
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=20,
@@ -577,7 +602,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Plains",
             state="OK",
             balancing_authority="SPP",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Oklahoma Wind Corridor",
                     distance_km=35,
@@ -591,16 +616,16 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=650,
                     project_type="wind",
                     status="under_construction"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="SPP-345-23",
                     distance_km=20,
                     voltage_kv=345,
                     capacity_available_mw=490
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=22,
@@ -612,23 +637,23 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Plains",
             state="KS",
             balancing_authority="SPP",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Kansas Wind Belt",
                     distance_km=42,
                     capacity_mw=750,
                     project_type="wind",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="SPP-345-45",
                     distance_km=18,
                     voltage_kv=345,
                     capacity_available_mw=510
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=23,
@@ -651,15 +676,15 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Plains",
             state="SD",
             balancing_authority="MISO",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Dakota Wind Project",
                     distance_km=30,
                     capacity_mw=550,
                     project_type="wind",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=25,
@@ -671,15 +696,15 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Plains",
             state="ND",
             balancing_authority="MISO",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Great Plains Wind Farm",
                     distance_km=45,
                     capacity_mw=600,
                     project_type="wind",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         
         # Mid-Atlantic (26-28)
@@ -693,7 +718,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Mid-Atlantic",
             state="PA",
             balancing_authority="PJM",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Allegheny Solar Initiative",
                     distance_km=38,
@@ -707,16 +732,16 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=2500,
                     project_type="nuclear",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="PJM-500-12",
                     distance_km=14,
                     voltage_kv=500,
                     capacity_available_mw=380
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=27,
@@ -728,7 +753,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Mid-Atlantic",
             state="VA",
             balancing_authority="PJM",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Virginia Offshore Wind",
                     distance_km=185,
@@ -742,8 +767,8 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=350,
                     project_type="solar",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=28,
@@ -755,23 +780,23 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Mid-Atlantic",
             state="MD",
             balancing_authority="PJM",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Chesapeake Offshore Wind",
                     distance_km=95,
                     capacity_mw=1500,
                     project_type="wind",
                     status="planned"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="PJM-345-67",
                     distance_km=22,
                     voltage_kv=345,
                     capacity_available_mw=320
-                )
-            ]
+                ),
+            )
         ),
         
         # Gulf Coast (29-32)
@@ -785,7 +810,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Gulf Coast",
             state="LA",
             balancing_authority="MISO",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Louisiana Solar Farm",
                     distance_km=48,
@@ -799,8 +824,8 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=1800,
                     project_type="wind",
                     status="planned"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=30,
@@ -812,15 +837,15 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Gulf Coast",
             state="MS",
             balancing_authority="MISO",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Mississippi Solar Initiative",
                     distance_km=35,
                     capacity_mw=300,
                     project_type="solar",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=31,
@@ -832,23 +857,23 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Gulf Coast",
             state="AL",
             balancing_authority="Southern Company",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Alabama Nuclear Plant",
                     distance_km=88,
                     capacity_mw=3600,
                     project_type="nuclear",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="SO-500-23",
                     distance_km=19,
                     voltage_kv=500,
                     capacity_available_mw=410
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=32,
@@ -860,15 +885,15 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Gulf Coast",
             state="FL",
             balancing_authority="Southern Company",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Florida Solar Belt",
                     distance_km=52,
                     capacity_mw=700,
                     project_type="solar",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         
         # Mountain West Expansion (33-36)
@@ -882,7 +907,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Mountain West",
             state="MT",
             balancing_authority="WAPA",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Montana Wind Corridor",
                     distance_km=62,
@@ -896,8 +921,8 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=500,
                     project_type="hydro",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=34,
@@ -909,23 +934,23 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Mountain West",
             state="WY",
             balancing_authority="WAPA",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Wyoming Wind Farm",
                     distance_km=40,
                     capacity_mw=650,
                     project_type="wind",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="WAPA-345-56",
                     distance_km=25,
                     voltage_kv=345,
                     capacity_available_mw=460
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=35,
@@ -937,7 +962,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="Mountain West",
             state="ID",
             balancing_authority="WECC",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Snake River Hydro Complex",
                     distance_km=55,
@@ -951,8 +976,8 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=400,
                     project_type="wind",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=36,
@@ -977,7 +1002,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="New England",
             state="MA",
             balancing_authority="ISO-NE",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Cape Cod Offshore Wind",
                     distance_km=85,
@@ -991,16 +1016,16 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=350,
                     project_type="solar",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="ISONE-345-12",
                     distance_km=12,
                     voltage_kv=345,
                     capacity_available_mw=310
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=38,
@@ -1012,15 +1037,15 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="New England",
             state="CT",
             balancing_authority="ISO-NE",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Long Island Sound Offshore Wind",
                     distance_km=68,
                     capacity_mw=1800,
                     project_type="wind",
                     status="planned"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=39,
@@ -1032,7 +1057,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="New England",
             state="ME",
             balancing_authority="ISO-NE",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Maine Offshore Wind",
                     distance_km=95,
@@ -1046,8 +1071,8 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=550,
                     project_type="hydro",
                     status="operational"
-                )
-            ]
+                ),
+            )
         ),
         GridNode(
             id=40,
@@ -1059,7 +1084,7 @@ def generate_mock_grid_nodes() -> List[GridNode]:
             region="New England",
             state="VT",
             balancing_authority="ISO-NE",
-            nearby_projects=[
+            nearby_projects=(
                 NearbyProject(
                     name="Vermont Wind Farm",
                     distance_km=38,
@@ -1073,26 +1098,65 @@ def generate_mock_grid_nodes() -> List[GridNode]:
                     capacity_mw=450,
                     project_type="hydro",
                     status="operational"
-                )
-            ],
-            transmission_lines=[
+                ),
+            ),
+            transmission_lines=(
                 TransmissionLine(
                     line_id="ISONE-345-34",
                     distance_km=28,
                     voltage_kv=345,
                     capacity_available_mw=280
-                )
-            ]
+                ),
+            )
         ),
-    ]
+    )
     
     return nodes
 
 
-def get_node_by_id(node_id: int, nodes: Optional[List[GridNode]] = None) -> GridNode:
-    """Get a specific grid node by ID"""
+# The mock data is static: build it once at import
+_MOCK_NODES: Tuple[GridNode, ...] = build_mock_grid_nodes()
+
+
+def _build_mock_indexes() -> Tuple[
+    Dict[int, GridNode],
+    Dict[str, Tuple[GridNode, ...]],
+    Dict[str, Tuple[GridNode, ...]]
+]:
+    """Index the mock nodes by ID, region, and state"""
+    by_region = defaultdict(list)
+    by_state = defaultdict(list)
+    for node in _MOCK_NODES:
+        by_region[node.region].append(node)
+        by_state[node.state].append(node)
+    
+    return (
+        {node.id: node for node in _MOCK_NODES},
+        {k: tuple(v) for k, v in by_region.items()},
+        {k: tuple(v) for k, v in by_state.items()}
+    )
+
+
+# ID/region/state indexes over the mock nodes
+_BY_ID, _BY_REGION, _BY_STATE = _build_mock_indexes()
+
+
+def get_node_by_id(node_id: int, nodes: Optional[Sequence[GridNode]] = None) -> GridNode:
+    """Get a specific grid node by ID (O(1) for the default mock nodes)"""
     if nodes is None:
-        nodes = generate_mock_grid_nodes()
+        try:
+            return _BY_ID[node_id]
+        except KeyError:
+            raise ValueError(f"Grid node with ID {node_id} not found")
+    
+    # Node lists are normally in ID order from 1 (the mock data and every
+    # list scored from it), so check the matching position before scanning
+    if 1 <= node_id <= len(nodes):
+        node = nodes[node_id - 1]
+        if node.id == node_id:
+            return node
+    
+    # Otherwise a one-off scan beats building a dict
     for node in nodes:
         if node.id == node_id:
             return node
@@ -1101,105 +1165,325 @@ def get_node_by_id(node_id: int, nodes: Optional[List[GridNode]] = None) -> Grid
 
 def get_nodes_by_region(region: str) -> List[GridNode]:
     """Filter nodes by region"""
-    nodes = generate_mock_grid_nodes()
-    return [node for node in nodes if node.region == region]
+    return list(_BY_REGION.get(region, ()))
 
 
 def get_nodes_by_state(state: str) -> List[GridNode]:
     """Filter nodes by state code"""
-    nodes = generate_mock_grid_nodes()
-    return [node for node in nodes if node.state == state]
+    return list(_BY_STATE.get(state, ()))
 
 
-def calculate_real_clean_gen_scores(
-    nodes: List[GridNode],
-    energy_sources: List,
-    demand_mw: Optional[float] = None
-) -> List[GridNode]:
+def _compact_array(values: Sequence[float]) -> np.ndarray:
     """
-    Calculate real clean_gen scores for grid nodes based on energy sources.
+    Pack numeric values into the narrowest dtype that holds them exactly.
     
-    Replaces mock clean_gen values with scores calculated from proximity
-    to actual renewable energy projects. Optionally considers capacity
-    adequacy relative to a target demand size.
+    Whole numbers get the smallest fitting integer type (e.g. reliability
+    58-84 -> uint8, capacity_mw < 4000 -> uint16). Fractional values stay
+    float64 so threshold filters give the same answers as the models.
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return arr.astype(np.uint8)
+    if np.all(arr == np.floor(arr)) and np.all(np.abs(arr) < 2**31):
+        dtype = np.result_type(
+            np.min_scalar_type(int(arr.min())),
+            np.min_scalar_type(int(arr.max()))
+        )
+        return arr.astype(dtype)
+    return arr
+
+
+def build_node_table(nodes: Sequence[GridNode]) -> Dict[str, np.ndarray]:
+    """
+    Build a Structure-of-Arrays view of grid nodes for vectorized scans.
+    
+    Columns are aligned with ``nodes``.
+    
+    Coordinates are stored as float32 (~1 m resolution, adequate for siting).
+    All other columns use the narrowest exact dtype (see _compact_array).
     
     Args:
-        nodes: List of GridNode objects with mock clean_gen scores
-        energy_sources: List of EnergySource objects from energy_sources.py
-        demand_mw: Optional demand size for capacity adequacy scoring
+        nodes: Grid nodes to tabulate
     
     Returns:
-        Updated list of GridNode objects with real clean_gen scores
+        Dict mapping column name to a NumPy array
+    """
+    latitudes = [n.coordinates.latitude for n in nodes]
+    longitudes = [n.coordinates.longitude for n in nodes]
+    
+    return {
+        "id": _compact_array([n.id for n in nodes]),
+        "latitude": np.array(latitudes, dtype=np.float32),
+        "longitude": np.array(longitudes, dtype=np.float32),
+        "clean_gen": _compact_array([n.clean_gen for n in nodes]),
+        "transmission_headroom": _compact_array([n.transmission_headroom for n in nodes]),
+        "reliability": _compact_array([n.reliability for n in nodes]),
+    }
+
+
+# Last energy-source list converted by _sources_to_soa(). Lists can't be
+# weakly referenced, so the list itself is held and matched by identity.
+_source_soa_cache: Optional[Tuple[List, int, Tuple[np.ndarray, ...]]] = None
+
+
+def _sources_to_soa(energy_sources: List) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert energy sources with valid coordinates to parallel float64 arrays.
+    
+    The result for the most recent list is cached, so scoring the same
+    sources repeatedly (e.g. several demand scenarios) skips the rebuild.
+    
+    Args:
+        energy_sources: List of EnergySource objects
+    
+    Returns:
+        Tuple of (lat, lon, mw, mult) arrays; sources without coordinates are skipped
+    """
+    global _source_soa_cache
+    
+    cached = _source_soa_cache
+    if cached is not None and cached[0] is energy_sources and cached[1] == len(energy_sources):
+        return cached[2]
+    
+    valid_sources = [s for s in energy_sources if s.coordinates is not None]
+    soa = (
+        np.ascontiguousarray([s.coordinates.latitude for s in valid_sources], dtype=np.float64),
+        np.ascontiguousarray([s.coordinates.longitude for s in valid_sources], dtype=np.float64),
+        np.ascontiguousarray([s.ppa_capacity_mw for s in valid_sources], dtype=np.float64),
+        np.ascontiguousarray([s.get_clean_multiplier() for s in valid_sources], dtype=np.float64),
+    )
+    _source_soa_cache = (energy_sources, len(energy_sources), soa)
+    return soa
+
+
+# Last power-plant list converted by _plants_to_soa(), held like _source_soa_cache
+_plant_soa_cache: Optional[Tuple[List, int, Tuple[np.ndarray, ...]]] = None
+
+
+def _plants_to_soa(power_plants: List) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert power plants to parallel float64 arrays (cached like _sources_to_soa).
+    
+    Args:
+        power_plants: List of PowerPlant objects
+    
+    Returns:
+        Tuple of (lat, lon, nameplate_mw) arrays
+    """
+    global _plant_soa_cache
+    
+    cached = _plant_soa_cache
+    if cached is not None and cached[0] is power_plants and cached[1] == len(power_plants):
+        return cached[2]
+    
+    soa = (
+        np.ascontiguousarray([p.latitude for p in power_plants], dtype=np.float64),
+        np.ascontiguousarray([p.longitude for p in power_plants], dtype=np.float64),
+        np.ascontiguousarray([p.nameplate_mw for p in power_plants], dtype=np.float64),
+    )
+    _plant_soa_cache = (power_plants, len(power_plants), soa)
+    return soa
+
+
+def _real_clean_gen_score_vector(
+    node_lats: np.ndarray,
+    node_lons: np.ndarray,
+    energy_sources: List,
+    demand_mw: Optional[float] = None
+) -> Optional[List[float]]:
+    """
+    Score clean_gen for every node from energy source proximity.
+    
+    Returns:
+        Scores aligned with the node arrays, or None to keep mock scores
     """
     try:
-        from scoring_utils import calculate_clean_gen_score, estimate_normalization_factor
+        logger.info("Calculating real clean gen scores for %d nodes using %d energy sources", len(node_lats), len(energy_sources))
+        if demand_mw is not None:
+            logger.info("  Using demand-aware scoring: %s MW target load", demand_mw)
         
-        logger.info(f"Calculating real clean gen scores for {len(nodes)} nodes using {len(energy_sources)} energy sources")
-        if demand_mw:
-            logger.info(f"  Using demand-aware scoring: {demand_mw} MW target load")
+        # Energy sources with valid coordinates, as parallel arrays
+        src_lat, src_lon, src_mw, src_mult = _sources_to_soa(energy_sources)
         
-        # Filter energy sources to only those with valid coordinates
-        valid_sources = [s for s in energy_sources if s.coordinates is not None]
-        
-        if not valid_sources:
+        if src_lat.size == 0:
             logger.warning("No energy sources with valid coordinates found, keeping mock scores")
-            return nodes
+            return None
         
-        logger.info(f"Using {len(valid_sources)} energy sources with valid coordinates")
+        logger.info("Using %d energy sources with valid coordinates", len(src_lat))
         
-        # Prepare energy source data for scoring
-        source_data = [
-            (
-                s.coordinates.latitude,
-                s.coordinates.longitude,
-                s.ppa_capacity_mw,
-                s.get_clean_multiplier()
+        # The normalization factor is estimated from all nodes (without demand adjustment)
+        if len(node_lats) * len(src_lat) < BATCH_MIN_PAIRS:
+            # Tiny inputs: plain-float scalar path, no NumPy dispatch
+            node_coords = list(zip(node_lats.tolist(), node_lons.tolist()))
+            source_data = list(zip(src_lat.tolist(), src_lon.tolist(), src_mw.tolist(), src_mult.tolist()))
+            normalization_factor = estimate_normalization_factor(node_coords, source_data)
+            scores = [
+                calculate_clean_gen_score(lat, lon, source_data, normalization_factor, demand_mw=demand_mw)
+                for lat, lon in node_coords
+            ]
+        else:
+            scores, normalization_factor = calculate_clean_gen_scores_batch(
+                node_lats, node_lons, src_lat, src_lon, src_mw * src_mult, demand_mw=demand_mw
             )
-            for s in valid_sources
-        ]
         
-        # Estimate normalization factor based on all nodes (without demand adjustment)
-        node_coords = [(n.coordinates.latitude, n.coordinates.longitude) for n in nodes]
-        normalization_factor = estimate_normalization_factor(node_coords, source_data)
+        logger.info("Using normalization factor: %.1f", normalization_factor)
+        return scores
         
-        logger.info(f"Using normalization factor: {normalization_factor:.1f}")
+    except Exception as e:
+        logger.error("Error calculating real clean gen scores: %s", e)
+        logger.warning("Keeping mock clean_gen scores")
+        return None
+
+
+def _real_transmission_score_vector(
+    node_lats: np.ndarray,
+    node_lons: np.ndarray,
+    power_plants: List
+) -> Optional[List[float]]:
+    """
+    Score transmission_headroom for every node from power plant proximity.
+    
+    Returns:
+        Scores aligned with the node arrays, or None to keep mock scores
+    """
+    try:
+        logger.info("Calculating real transmission scores for %d nodes using %d power plants", len(node_lats), len(power_plants))
+        
+        if not power_plants:
+            logger.warning("No power plants found, keeping mock transmission scores")
+            return None
         
-        # Calculate clean gen score for each node
-        updated_nodes = []
-        for node in nodes:
-            old_score = node.clean_gen
-            
-            # Calculate new score with optional demand adequacy
-            new_score = calculate_clean_gen_score(
-                node.coordinates.latitude,
-                node.coordinates.longitude,
-                source_data,
-                normalization_factor,
-                demand_mw=demand_mw
+        # Normalization factor is estimated from all nodes
+        if len(node_lats) * len(power_plants) < BATCH_MIN_PAIRS:
+            # Tiny inputs: plain-float scalar path, no NumPy dispatch
+            node_coords = list(zip(node_lats.tolist(), node_lons.tolist()))
+            normalization_factor = estimate_transmission_normalization_factor(node_coords, power_plants)
+            scores = [
+                calculate_transmission_score(lat, lon, power_plants, normalization_factor)
+                for lat, lon in node_coords
+            ]
+        else:
+            plant_lat, plant_lon, plant_mw = _plants_to_soa(power_plants)
+            scores, normalization_factor = calculate_transmission_scores_batch(
+                node_lats, node_lons, plant_lat, plant_lon, plant_mw
             )
-            
-            # Update node (create new instance to maintain immutability)
-            updated_node = node.model_copy(update={"clean_gen": new_score})
-            updated_nodes.append(updated_node)
-            
-            logger.info(f"  {node.name}: {old_score:.1f} → {new_score:.1f} (delta: {new_score - old_score:+.1f})")
         
-        return updated_nodes
+        logger.info("Using transmission normalization factor: %.1f", normalization_factor)
+        return scores
         
-    except ImportError as e:
-        logger.error(f"Failed to import scoring utilities: {e}")
-        logger.warning("Keeping mock clean_gen scores")
-        return nodes
     except Exception as e:
-        logger.error(f"Error calculating real clean gen scores: {e}")
-        logger.warning("Keeping mock clean_gen scores")
+        logger.error("Error calculating real transmission scores: %s", e)
+        logger.warning("Keeping mock transmission scores")
+        return None
+
+
+def _fast_update(node: GridNode, **fields) -> GridNode:
+    """
+    Return a shallow copy of node with fields replaced, without validation.
+    
+    Equivalent to node.model_copy(update=fields) (which doesn't validate
+    either) but skips its model_fields_set bookkeeping; about 25% faster per
+    node. Callers must pass values of the declared field types. Falls back
+    to model_copy if the instance dict can't be written directly.
+    """
+    copied = copy.copy(node)
+    try:
+        copied.__dict__.update(fields)
+    except (AttributeError, TypeError):
+        return node.model_copy(update=fields)
+    return copied
+
+
+def calculate_real_scores(
+    nodes: Sequence[GridNode],
+    energy_sources: Optional[List] = None,
+    power_plants: Optional[List] = None,
+    demand_mw: Optional[float] = None
+) -> Sequence[GridNode]:
+    """
+    Calculate real clean_gen and transmission_headroom scores in one pass.
+    
+    Node coordinates are extracted once and shared by both scoring kernels,
+    and each node is copied once with all updated fields.
+    
+    Args:
+        nodes: Sequence of GridNode objects with mock scores
+        energy_sources: Optional list of EnergySource objects (clean_gen)
+        power_plants: Optional list of PowerPlant objects, all fuel types (transmission_headroom)
+        demand_mw: Optional demand size for capacity adequacy scoring
+    
+    Returns:
+        Updated list of GridNode objects; nodes unchanged if nothing was scored
+    """
+    node_lats = np.array([n.coordinates.latitude for n in nodes], dtype=np.float64)
+    node_lons = np.array([n.coordinates.longitude for n in nodes], dtype=np.float64)
+    
+    field_scores = {}
+    if energy_sources is not None:
+        clean_scores = _real_clean_gen_score_vector(node_lats, node_lons, energy_sources, demand_mw)
+        if clean_scores is not None:
+            field_scores["clean_gen"] = clean_scores
+    if power_plants is not None:
+        transmission_scores = _real_transmission_score_vector(node_lats, node_lons, power_plants)
+        if transmission_scores is not None:
+            field_scores["transmission_headroom"] = transmission_scores
+    
+    if not field_scores:
         return nodes
+    
+    log_each_node = logger.isEnabledFor(logging.DEBUG)
+    
+    updated_nodes = [None] * len(nodes)
+    for i, node in enumerate(nodes):
+        update = {field: scores[i] for field, scores in field_scores.items()}
+        
+        # Update node (create new instance to maintain immutability)
+        updated_nodes[i] = _fast_update(node, **update)
+        
+        if log_each_node:
+            for field, new_score in update.items():
+                old_score = getattr(node, field)
+                logger.debug("  %s: %s %.1f → %.1f (delta: %+.1f)", node.name, field, old_score, new_score, new_score - old_score)
+    
+    # One summary line per score family instead of one line per node
+    if logger.isEnabledFor(logging.INFO):
+        for field, scores in field_scores.items():
+            deltas = np.asarray(scores) - np.array([getattr(n, field) for n in nodes])
+            logger.info(
+                "Updated %s for %d nodes, delta min/mean/max: %+.1f/%+.1f/%+.1f",
+                field, len(deltas), deltas.min(), deltas.mean(), deltas.max()
+            )
+    
+    return updated_nodes
+
+
+def calculate_real_clean_gen_scores(
+    nodes: Sequence[GridNode],
+    energy_sources: List,
+    demand_mw: Optional[float] = None
+) -> Sequence[GridNode]:
+    """
+    Calculate real clean_gen scores for grid nodes based on energy sources.
+    
+    Replaces mock clean_gen values with scores calculated from proximity
+    to actual renewable energy projects. Optionally considers capacity
+    adequacy relative to a target demand size.
+    
+    Args:
+        nodes: List of GridNode objects with mock clean_gen scores
+        energy_sources: List of EnergySource objects from energy_sources.py
+        demand_mw: Optional demand size for capacity adequacy scoring
+    
+    Returns:
+        Updated list of GridNode objects with real clean_gen scores
+    """
+    return calculate_real_scores(nodes, energy_sources=energy_sources, demand_mw=demand_mw)
 
 
 def calculate_real_transmission_scores(
-    nodes: List[GridNode],
+    nodes: Sequence[GridNode],
     power_plants: List
-) -> List[GridNode]:
+) -> Sequence[GridNode]:
     """
     Calculate real transmission_headroom scores for grid nodes based on ALL power plants.
     
@@ -1213,56 +1497,13 @@ def calculate_real_transmission_scores(
     Returns:
         Updated list of GridNode objects with real transmission_headroom scores
     """
-    try:
-        from scoring_utils import calculate_transmission_score, estimate_transmission_normalization_factor
-        
-        logger.info(f"Calculating real transmission scores for {len(nodes)} nodes using {len(power_plants)} power plants")
-        
-        if not power_plants:
-            logger.warning("No power plants found, keeping mock transmission scores")
-            return nodes
-        
-        # Estimate normalization factor based on all nodes
-        node_coords = [(n.coordinates.latitude, n.coordinates.longitude) for n in nodes]
-        normalization_factor = estimate_transmission_normalization_factor(node_coords, power_plants)
-        
-        logger.info(f"Using transmission normalization factor: {normalization_factor:.1f}")
-        
-        # Calculate transmission score for each node
-        updated_nodes = []
-        for node in nodes:
-            old_score = node.transmission_headroom
-            
-            # Calculate new score using ALL power plants
-            new_score = calculate_transmission_score(
-                node.coordinates.latitude,
-                node.coordinates.longitude,
-                power_plants,
-                normalization_factor
-            )
-            
-            # Update node (create new instance to maintain immutability)
-            updated_node = node.model_copy(update={"transmission_headroom": new_score})
-            updated_nodes.append(updated_node)
-            
-            logger.info(f"  {node.name}: transmission {old_score:.1f} → {new_score:.1f} (delta: {new_score - old_score:+.1f})")
-        
-        return updated_nodes
-        
-    except ImportError as e:
-        logger.error(f"Failed to import scoring utilities: {e}")
-        logger.warning("Keeping mock transmission scores")
-        return nodes
-    except Exception as e:
-        logger.error(f"Error calculating real transmission scores: {e}")
-        logger.warning("Keeping mock transmission scores")
-        return nodes
+    return calculate_real_scores(nodes, power_plants=power_plants)
 
 
 def generate_grid_nodes_with_real_scores(
     energy_sources: Optional[List] = None,
     power_plants: Optional[List] = None
-) -> List[GridNode]:
+) -> Sequence[GridNode]:
     """
     Generate grid nodes with real scores if data is provided.
     
@@ -1276,26 +1517,27 @@ def generate_grid_nodes_with_real_scores(
                      power infrastructure data (all fuel types).
     
     Returns:
-        List of GridNode objects with either real or mock scores
+        Sequence of GridNode objects with either real or mock scores
     """
     # Generate base nodes with mock data
     nodes = generate_mock_grid_nodes()
     
-    # If energy sources provided, calculate real clean_gen scores
     if energy_sources:
         logger.info("Energy sources provided, calculating real clean_gen scores")
-        nodes = calculate_real_clean_gen_scores(nodes, energy_sources)
     else:
         logger.info("No energy sources provided, using mock clean_gen scores")
     
-    # If power plants provided, calculate real transmission_headroom scores
     if power_plants:
         logger.info("Power plants provided, calculating real transmission_headroom scores")
-        nodes = calculate_real_transmission_scores(nodes, power_plants)
     else:
         logger.info("No power plants provided, using mock transmission_headroom scores")
     
-    return nodes
+    # Both score families are computed together over the same node coordinates
+    return calculate_real_scores(
+        nodes,
+        energy_sources=energy_sources or None,
+        power_plants=power_plants or None
+    )
 
 
 # Quick stats for documentation
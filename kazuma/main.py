@@ -5,13 +5,22 @@ FastAPI application for optimal siting of electro-intensive loads.
 Provides endpoints for grid node data, siting evaluation, and scenario comparison.
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Path, Query, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List, Literal
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, Optional, List, Literal, Tuple
+import asyncio
+import atexit
+import hashlib
 import logging
+import logging.handlers
 import os
+import queue
+import numpy as np
+import orjson
 
 # Import grid siting modules
 from models import (
@@ -25,37 +34,64 @@ from models import (
     PowerPlant,
     PowerPlantFilters,
     LocationEvaluationRequest,
-    GridNodeCoordinates
+    GridNodeCoordinates,
+    get_fuel_category_color,
+    get_fuel_category_icon,
+    power_plant_features,
+    get_siting_weights
 )
 from grid_data import (
+    build_node_table,
     generate_mock_grid_nodes,
     get_node_by_id,
     generate_grid_nodes_with_real_scores
 )
 from siting_engine import SitingEngine
+from scoring_utils import invalidate_normalization_cache
 from power_plants_data import (
+    build_plant_table,
     get_all_power_plants,
-    filter_power_plants,
-    power_plants_to_geojson,
-    get_fuel_category_stats
+    filter_plant_indices,
+    geojson_metadata_from_table,
+    get_fuel_category_stats_from_table,
+    tile_bounds
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging. Handlers only enqueue records; a background
+# QueueListener thread owns the stream handler, so request handlers never
+# block on writing to the log sink.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_stream_handler, respect_handler_level=True
+)
+logging.root.addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.root.setLevel(logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Smart Grid Siting Framework",
     description="Intelligent siting framework for large electro-intensive loads to optimize grid integration",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson encodes the (often large) JSON payloads in C and accepts int dict keys
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware (hackathon mode)
+# Add CORS middleware. The bundled frontend is same-origin; CORS_ORIGINS
+# (comma-separated) lists any other dev frontends allowed to call the API.
+# No cookies or auth headers are used, so credentials stay disabled.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8000").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -71,17 +107,208 @@ energy_sources = []  # Will be populated by load_energy_sources()
 grid_nodes = []  # Will be populated with real scores if energy sources loaded
 power_plants = []  # Will be populated by load_power_plants()
 
-# Scenarios storage (in-memory for demo)
-saved_scenarios: List[SiteEvaluation] = []
+# Bodies of the read-only endpoints are encoded once, with a strong ETag over
+# the bytes; clients revalidate with If-None-Match (see _json_body_response)
+EncodedBody = Tuple[bytes, str]
+EMPTY_BODY: EncodedBody = (b"", "")
+READ_ONLY_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+# Node lists at least this long are streamed in
+# chunks rather than encoded as one document (see _stream_rows_response)
+STREAM_MIN_NODES = 1000
+STREAM_CHUNK_NODES = 256
+
+# Lookups derived from grid_nodes (rebuilt by _refresh_node_caches)
+regions_body: EncodedBody = EMPTY_BODY
+states_body: EncodedBody = EMPTY_BODY
+grid_nodes_by_id: Dict[int, GridNode] = {}
+node_feature_rows: List[bytes] = []
+node_json_by_id: Dict[int, bytes] = {}
+grid_node_table: Dict[str, np.ndarray] = {}
+all_nodes_geojson_body: EncodedBody = EMPTY_BODY
+
+# Region/state filtered /api/grid/nodes/geojson bodies keyed by
+# (region, state); only non-empty results are kept, so the keys are bounded
+# by the real region/state combinations. _refresh_node_caches clears it.
+NODES_GEOJSON_CACHE_SIZE = 128
+nodes_geojson_cache: Dict[Tuple[Optional[str], Optional[str]], EncodedBody] = {}
+
+# Scenarios storage (in-memory for demo): a bounded ring of (evaluation,
+# encoded JSON) pairs. Scenario IDs keep counting up as old entries are
+# evicted or cleared, so IDs are never reused; saved_scenarios[0] has ID
+# saved_scenarios_first_id.
+MAX_SAVED_SCENARIOS = 1000
+saved_scenarios: Deque[Tuple[SiteEvaluation, bytes]] = deque(maxlen=MAX_SAVED_SCENARIOS)
+saved_scenarios_first_id = 0
+
+# /health body, rebuilt by _refresh_health_response whenever loaded data changes
+health_response: dict = {}
+
+
+def _encode_body(data) -> EncodedBody:
+    """JSON-encode data (unless already bytes) and compute its ETag"""
+    content = data if isinstance(data, bytes) else orjson.dumps(data)
+    return content, '"%s"' % hashlib.sha1(content).hexdigest()[:16]
+
+
+def _json_body_response(request: Request, body: EncodedBody) -> Response:
+    """Serve a pre-encoded body, or 304 Not Modified if the client has it"""
+    content, etag = body
+    headers = {"ETag": etag, "Cache-Control": READ_ONLY_CACHE_CONTROL}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+# Column arrays and pre-encoded JSON objects / GeoJSON features aligned with
+# power_plants, plus the stats and fuel-category bodies (all rebuilt by
+# _refresh_plant_caches)
+power_plant_table: Dict[str, np.ndarray] = {}
+power_plant_json_rows: List[bytes] = []
+power_plant_feature_rows: Optional[List[bytes]] = None
+power_plant_stats_body: EncodedBody = EMPTY_BODY
+fuel_categories_body: EncodedBody = EMPTY_BODY
+
+# Serialized /api/power-plants/geojson bodies keyed by filter parameters;
+# oldest entries are evicted first, and _refresh_plant_caches clears it
+POWER_PLANTS_GEOJSON_CACHE_SIZE = 64
+# Bodies run up to ~4 MB (the unfiltered collection) and every uvicorn worker
+# holds its own cache, so it is also capped by total size
+POWER_PLANTS_GEOJSON_CACHE_BYTES = 32 * 1024 * 1024
+power_plants_geojson_cache: Dict[tuple, EncodedBody] = {}
+# Bodies being built, by filter key, so concurrent misses on the same
+# filter share one build instead of each encoding the collection
+power_plants_geojson_builds: Dict[tuple, asyncio.Task] = {}
+
+# Filtered plant indices keyed the same way, shared by /api/power-plants and
+# /api/power-plants/geojson; same eviction, also cleared on reload
+POWER_PLANT_INDEX_CACHE_SIZE = 128
+power_plant_index_cache: Dict[tuple, np.ndarray] = {}
+
+# Derived from energy_sources (rebuilt by _refresh_source_caches):
+# (name, lat, lon, capacity_mw, type) rows for find_nearby_sources, reused so
+# their spatial index stays cached; /api/energy-sources dicts plus the
+# lowercased type and capacity columns it filters on; and the encoded
+# geojson/stats bodies
+energy_source_rows: Tuple[tuple, ...] = ()
+energy_source_dicts: List[dict] = []
+energy_source_types: np.ndarray = np.empty(0, dtype=object)
+energy_source_capacity_mw: np.ndarray = np.empty(0)
+energy_sources_geojson_body: EncodedBody = EMPTY_BODY
+energy_source_stats_body: EncodedBody = EMPTY_BODY
+
+# Pre-geocoded sources shown on the map when none are loaded
+HARDCODED_ENERGY_SOURCES = [
+    {"name": "360 Solar", "address": "21501 Hull Street Road, Mosley, VA", "lat": 37.4019, "lon": -77.5311, "capacity": 52, "type": "Solar"},
+    {"name": "Wythe County", "address": "Foster Falls Road, Suffolk, VA", "lat": 36.9204, "lon": -76.5833, "capacity": 52, "type": "Solar"},
+    {"name": "Waterloo Solar", "address": "Bastrop County, Texas", "lat": 30.0000, "lon": -97.1167, "capacity": 52, "type": "Solar"},
+    {"name": "Switchgrass", "address": "Hoosier Road, Suffolk, VA", "lat": 36.7286, "lon": -76.5833, "capacity": 52, "type": "Solar"},
+    {"name": "Lafitte Solar Park", "address": "343 McHenry Gin Rd., Monroe, LA 71202", "lat": 32.5093, "lon": -92.1221, "capacity": 52, "type": "Solar"},
+    {"name": "Harrisonburg", "address": "3793 Kratzer Road, Harrisonburg, VA", "lat": 38.4496, "lon": -78.8689, "capacity": 52, "type": "Solar"},
+    {"name": "Groves", "address": "Westmoreland County, VA", "lat": 38.0293, "lon": -76.8803, "capacity": 52, "type": "Solar"},
+    {"name": "Bluestem", "address": "LaPorte County, Indiana", "lat": 41.6094, "lon": -86.7326, "capacity": 52, "type": "Battery Storage + Solar"},
+    {"name": "Big Pine", "address": "Sussex County, Virginia", "lat": 36.8468, "lon": -77.2803, "capacity": 52, "type": "Solar"},
+]
+
+# ...and as GeoJSON features (shared by every fallback response)
+HARDCODED_ENERGY_SOURCE_FEATURES = [
+    {
+        "type": "Feature",
+        "properties": {
+            "name": source["name"],
+            "energy_source": source["type"],
+            "capacity_mw": source["capacity"],
+            "address": source["address"],
+            "clean_multiplier": 1.0 if "solar" in source["type"].lower() else 0.95,
+        },
+        "geometry": {
+            "type": "Point",
+            "coordinates": [source["lon"], source["lat"]]  # [longitude, latitude]
+        }
+    }
+    for source in HARDCODED_ENERGY_SOURCES
+]
 
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve the map view (home page)"""
-    try:
-        return FileResponse("static/map.html")
-    except FileNotFoundError:
-        return HTMLResponse("""
+def _stream_rows_response(head: bytes, rows: List[bytes], tail: bytes) -> StreamingResponse:
+    """
+    Stream a JSON body made of pre-encoded rows without joining it in memory.
+    
+    Produces head + comma-joined rows + tail, emitting STREAM_CHUNK_NODES
+    rows per chunk.
+    
+    Args:
+        head: Body bytes up to and including the array's opening bracket
+        rows: Encoded array elements, in order
+        tail: Body bytes from the array's closing bracket on
+    
+    Returns:
+        StreamingResponse with an application/json body
+    """
+    def chunks():
+        yield head
+        for start in range(0, len(rows), STREAM_CHUNK_NODES):
+            yield (b"," if start else b"") + b",".join(rows[start:start + STREAM_CHUNK_NODES])
+        yield tail
+    
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
+def _refresh_node_caches():
+    """Rebuild the lookups derived from grid_nodes; call after every reassignment"""
+    global node_feature_rows, node_json_by_id, all_nodes_geojson_body
+    global grid_node_table, grid_nodes_by_id, regions_body, states_body
+    
+    # Cached rankings were computed over the previous node set
+    _ranked_sites.cache_clear()
+    _ranking_rows.cache_clear()
+    nodes_geojson_cache.clear()
+    
+    grid_nodes_by_id = {node.id: node for node in grid_nodes}
+    
+    # Region/state listings only change with the node set
+    sorted_regions = sorted({node.region for node in grid_nodes if node.region})
+    sorted_states = sorted({node.state for node in grid_nodes if node.state})
+    regions_body = _encode_body({"regions": sorted_regions, "total": len(sorted_regions)})
+    states_body = _encode_body({"states": sorted_states, "total": len(sorted_states)})
+    
+    # Column arrays aligned with grid_nodes, for vectorized filtering
+    grid_node_table = build_node_table(grid_nodes)
+    grid_node_table["region"] = np.array([node.region for node in grid_nodes], dtype=object)
+    grid_node_table["state"] = np.array([node.state for node in grid_nodes], dtype=object)
+    
+    # Serialized forms are static per node set; node objects are encoded
+    # once here and spliced into /api/grid/nodes bodies
+    node_json_by_id = {node.id: orjson.dumps(node.model_dump()) for node in grid_nodes}
+    
+    # GeoJSON features too (aligned with grid_node_table); the unfiltered
+    # collection is validated and encoded once
+    node_features = [node.to_geojson_feature() for node in grid_nodes]
+    node_feature_rows = [orjson.dumps(feature) for feature in node_features]
+    all_nodes_geojson_body = _encode_body(GeoJSONResponse(
+        features=node_features,
+        metadata={
+            "total_nodes": len(node_features),
+            "region_filter": None,
+            "state_filter": None
+        }
+    ).model_dump())
+
+
+# Page files and their fallbacks. Existence is checked once at import:
+# FileResponse only stats the file when sending, so a missing page would
+# otherwise surface as a 500 rather than the fallback.
+MAP_HTML = "static/map.html"
+FRAMEWORK_HTML = "static/framework.html"
+MAP_HTML_EXISTS = os.path.isfile(MAP_HTML)
+FRAMEWORK_HTML_EXISTS = os.path.isfile(FRAMEWORK_HTML)
+
+MAP_FALLBACK_HTML = """
         <!DOCTYPE html>
         <html>
         <head><title>Smart Grid Siting Framework</title></head>
@@ -91,16 +318,9 @@ async def root():
             <p><a href="/framework">Go to Siting Framework →</a></p>
         </body>
         </html>
-        """)
+        """
 
-
-@app.get("/framework", response_class=HTMLResponse)
-async def framework_page():
-    """Serve the siting framework (optimization page)"""
-    try:
-        return FileResponse("static/framework.html")
-    except FileNotFoundError:
-        return HTMLResponse("""
+FRAMEWORK_FALLBACK_HTML = """
         <!DOCTYPE html>
         <html>
         <head><title>Siting Framework</title></head>
@@ -110,58 +330,247 @@ async def framework_page():
             <p><a href="/">← Back to Map View</a></p>
         </body>
         </html>
-        """)
+        """
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Load energy sources, power plants, and initialize grid nodes on startup"""
-    global energy_sources, grid_nodes, power_plants
+@app.get("/", response_class=HTMLResponse)
+async def root():
+    """Serve the map view (home page)"""
+    if not MAP_HTML_EXISTS:
+        return HTMLResponse(MAP_FALLBACK_HTML)
+    return FileResponse(MAP_HTML)
+
+
+@app.get("/framework", response_class=HTMLResponse)
+async def framework_page():
+    """Serve the siting framework (optimization page)"""
+    if not FRAMEWORK_HTML_EXISTS:
+        return HTMLResponse(FRAMEWORK_FALLBACK_HTML)
+    return FileResponse(FRAMEWORK_HTML)
+
+
+def _refresh_plant_caches():
+    """
+    Rebuild the data derived from power_plants; call after every reload.
     
-    logger.info("=== Smart Grid Siting Framework Startup ===")
+    The stats and fuel-category endpoints only depend on the plant list, so
+    their bodies are aggregated here once rather than per request.
+    """
+    global power_plant_table, power_plant_json_rows, power_plant_feature_rows
+    global power_plant_stats_body, fuel_categories_body
+    
+    power_plant_table = build_plant_table(power_plants)
+    power_plant_json_rows = [orjson.dumps(p.model_dump()) for p in power_plants]
+    power_plant_feature_rows = None  # GeoJSON features are encoded on first use
+    power_plants_geojson_cache.clear()
+    power_plants_geojson_builds.clear()
+    power_plant_index_cache.clear()
+    
+    if not power_plants:
+        power_plant_stats_body = EMPTY_BODY
+        fuel_categories_body = EMPTY_BODY
+        return
+    
+    stats = get_fuel_category_stats_from_table(power_plant_table)
+    total_plants = len(power_plants)
+    renewable_count = int(power_plant_table["is_renewable"].sum())
+    clean_count = int(power_plant_table["is_clean"].sum())
+    
+    power_plant_stats_body = _encode_body({
+        "total_plants": total_plants,
+        "renewable_count": renewable_count,
+        "renewable_percentage": round(renewable_count / total_plants * 100, 1),
+        "clean_count": clean_count,
+        "clean_percentage": round(clean_count / total_plants * 100, 1),
+        "by_fuel_category": stats
+    })
+    
+    categories = [
+        {
+            "category": category,
+            "color": get_fuel_category_color(category),
+            "icon": get_fuel_category_icon(category),
+            "count": stats[category]["count"],
+            "total_capacity_mw": stats[category]["total_capacity_mw"]
+        }
+        for category in sorted(stats)
+    ]
+    fuel_categories_body = _encode_body({
+        "fuel_categories": categories,
+        "total": len(categories)
+    })
+
+
+def _energy_sources_geojson() -> dict:
+    """Build the /api/energy-sources/geojson body from the loaded energy sources"""
+    features = []
+    
+    # If energy sources loaded from file
+    if energy_sources:
+        for source in energy_sources:
+            if source.coordinates:  # Only include geocoded sources
+                try:
+                    features.append(source.to_geojson_feature())
+                except Exception as e:
+                    logger.warning(f"Failed to convert {source.name} to GeoJSON: {e}")
+    
+    # Fallback: Use hardcoded coordinates if no sources loaded
+    if not features:
+        logger.info("Using hardcoded energy source coordinates")
+        features = HARDCODED_ENERGY_SOURCE_FEATURES
+    
+    return {
+        "type": "FeatureCollection",
+        "features": features,
+        "metadata": {
+            "total_sources": len(HARDCODED_ENERGY_SOURCES),
+            "geocoded_sources": len(features),
+            "total_capacity_mw": sum(f["properties"]["capacity_mw"] for f in features) if features else 468
+        }
+    }
+
+
+def _energy_source_stats() -> dict:
+    """Build the /api/energy-sources/stats body from the loaded energy sources"""
+    if not energy_sources:
+        return {
+            "total_sources": 0,
+            "total_capacity_mw": 0,
+            "by_type": {},
+            "geocoded_count": 0,
+            "using_real_scores": False
+        }
+    
+    # Count by energy type
+    by_type = {}
+    for source in energy_sources:
+        energy_type = source.energy_source
+        if energy_type not in by_type:
+            by_type[energy_type] = {"count": 0, "capacity_mw": 0}
+        by_type[energy_type]["count"] += 1
+        by_type[energy_type]["capacity_mw"] += source.ppa_capacity_mw
+    
+    geocoded_count = sum(1 for s in energy_sources if s.coordinates is not None)
+    
+    return {
+        "total_sources": len(energy_sources),
+        "total_capacity_mw": sum(s.ppa_capacity_mw for s in energy_sources),
+        "by_type": by_type,
+        "geocoded_count": geocoded_count,
+        "geocoding_rate": f"{(geocoded_count / len(energy_sources) * 100):.1f}%" if energy_sources else "0%",
+        "using_real_scores": len(energy_sources) > 0
+    }
+
+
+def _refresh_source_caches():
+    """Rebuild the data derived from energy_sources; call after every reload"""
+    global energy_source_rows, energy_source_dicts, energy_source_types, energy_source_capacity_mw
+    global energy_sources_geojson_body, energy_source_stats_body
+    
+    energy_source_rows = tuple(
+        (
+            s.name,
+            s.coordinates.latitude,
+            s.coordinates.longitude,
+            s.ppa_capacity_mw,
+            s.energy_source
+        )
+        for s in energy_sources
+        if s.coordinates is not None
+    )
+    
+    # /api/energy-sources rows, with the columns its filters test
+    energy_source_dicts = [
+        {
+            "name": s.name,
+            "energy_source": s.energy_source,
+            "capacity_mw": s.ppa_capacity_mw,
+            "address": s.address,
+            "coordinates": {
+                "latitude": s.coordinates.latitude,
+                "longitude": s.coordinates.longitude
+            } if s.coordinates else None,
+            "clean_multiplier": s.get_clean_multiplier()
+        }
+        for s in energy_sources
+    ]
+    energy_source_types = np.array([s.energy_source.lower() for s in energy_sources], dtype=object)
+    energy_source_capacity_mw = np.array([s.ppa_capacity_mw for s in energy_sources], dtype=np.float64)
+    
+    # Both bodies only change with the sources, so encode them once here
+    energy_sources_geojson_body = _encode_body(_energy_sources_geojson())
+    energy_source_stats_body = _encode_body(_energy_source_stats())
+
+
+def _refresh_health_response():
+    """Rebuild the cached /health body from the currently loaded data"""
+    global health_response
     
-    # Load energy sources for clean gen scoring
+    health_response = {
+        "status": "healthy",
+        "service": "smart-grid-siting",
+        "version": "1.0.0",
+        "nodes_loaded": len(grid_nodes),
+        "energy_sources_loaded": len(energy_sources),
+        "power_plants_loaded": len(power_plants),
+        "using_real_clean_gen": len(energy_sources) > 0,
+        "using_real_transmission": len(power_plants) > 0
+    }
+
+
+def _load_energy_sources_or_empty() -> list:
+    """Load energy sources for clean gen scoring, or [] to fall back to mock scores"""
     try:
         from energy_sources import load_energy_sources
         
         logger.info("Loading energy sources from JSON...")
-        energy_sources = load_energy_sources()
-        logger.info(f"Successfully loaded {len(energy_sources)} energy sources")
+        sources = load_energy_sources()
+        logger.info(f"Successfully loaded {len(sources)} energy sources")
+        return sources
         
     except FileNotFoundError as e:
         logger.warning(f"Energy sources file not found: {e}")
-        logger.info("Will use mock clean gen scores")
-        energy_sources = []
     except ImportError as e:
         logger.warning(f"Failed to import energy_sources module: {e}")
-        logger.info("Will use mock clean gen scores")
-        energy_sources = []
     except Exception as e:
         logger.error(f"Error loading energy sources: {e}")
-        logger.info("Will use mock clean gen scores")
-        energy_sources = []
-    
-    # Load US power plants for transmission scoring
+    logger.info("Will use mock clean gen scores")
+    return []
+
+
+def _load_power_plants_or_empty() -> list:
+    """Load US power plants for transmission scoring, or [] to fall back to mock scores"""
     try:
         logger.info("Loading US power plants from eGRID data...")
-        power_plants = get_all_power_plants()
-        logger.info(f"Successfully loaded {len(power_plants)} power plants")
+        plants = get_all_power_plants()
+        logger.info(f"Successfully loaded {len(plants)} power plants")
         
-        # Show quick stats
-        stats = get_fuel_category_stats(power_plants)
-        renewable_count = sum(p.is_renewable() for p in power_plants)
-        clean_count = sum(p.is_clean() for p in power_plants)
-        logger.info(f"  Clean energy: {clean_count} plants ({clean_count/len(power_plants)*100:.1f}%)")
-        logger.info(f"  All plants: {len(power_plants)} (will be used for transmission scoring)")
+        # Show quick stats (one pass; only the clean share is logged)
+        clean_count = sum(p.is_clean() for p in plants)
+        logger.info(f"  Clean energy: {clean_count} plants ({clean_count/len(plants)*100:.1f}%)")
+        logger.info(f"  All plants: {len(plants)} (will be used for transmission scoring)")
+        return plants
         
     except FileNotFoundError as e:
         logger.warning(f"Power plants file not found: {e}")
-        logger.info("Will use mock transmission scores")
-        power_plants = []
     except Exception as e:
         logger.error(f"Error loading power plants: {e}")
-        logger.info("Will use mock transmission scores")
-        power_plants = []
+    logger.info("Will use mock transmission scores")
+    return []
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Load energy sources, power plants, and initialize grid nodes on startup"""
+    global energy_sources, grid_nodes, power_plants
+    
+    logger.info("=== Smart Grid Siting Framework Startup ===")
+    
+    # The two datasets are independent file loads: read them concurrently
+    energy_sources, power_plants = await asyncio.gather(
+        asyncio.to_thread(_load_energy_sources_or_empty),
+        asyncio.to_thread(_load_power_plants_or_empty)
+    )
     
     # Generate grid nodes with real scores (clean_gen + transmission_headroom)
     try:
@@ -187,22 +596,18 @@ async def startup_event():
         logger.info("Falling back to mock grid nodes")
         grid_nodes = generate_mock_grid_nodes()
     
+    _refresh_node_caches()
+    _refresh_plant_caches()
+    _refresh_source_caches()
+    _refresh_health_response()
+    
     logger.info(f"Startup complete: {len(grid_nodes)} nodes, {len(energy_sources)} energy sources, {len(power_plants)} power plants")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "smart-grid-siting",
-        "version": "1.0.0",
-        "nodes_loaded": len(grid_nodes),
-        "energy_sources_loaded": len(energy_sources),
-        "power_plants_loaded": len(power_plants),
-        "using_real_clean_gen": len(energy_sources) > 0,
-        "using_real_transmission": len(power_plants) > 0
-    }
+    return health_response
 
 
 @app.get("/api/config")
@@ -238,39 +643,51 @@ async def get_grid_nodes(
     
     Returns list of grid nodes with metadata.
     """
-    nodes = grid_nodes
+    # Only the active filters are evaluated, combined into one boolean mask
+    # over the node columns; with none active every node is returned as-is
+    conditions = []
     
-    # Apply filters
     if region:
-        nodes = [n for n in nodes if n.region == region]
+        conditions.append(grid_node_table["region"] == region)
     
     if state:
-        nodes = [n for n in nodes if n.state == state]
+        conditions.append(grid_node_table["state"] == state)
     
     if min_clean_gen is not None:
-        nodes = [n for n in nodes if n.clean_gen >= min_clean_gen]
+        conditions.append(grid_node_table["clean_gen"] >= min_clean_gen)
     
     if min_transmission is not None:
-        nodes = [n for n in nodes if n.transmission_headroom >= min_transmission]
+        conditions.append(grid_node_table["transmission_headroom"] >= min_transmission)
     
     if min_reliability is not None:
-        nodes = [n for n in nodes if n.reliability >= min_reliability]
-    
-    return {
-        "nodes": [n.dict() for n in nodes],
-        "total": len(nodes),
-        "filters_applied": {
-            "region": region,
-            "state": state,
-            "min_clean_gen": min_clean_gen,
-            "min_transmission": min_transmission,
-            "min_reliability": min_reliability
-        }
+        conditions.append(grid_node_table["reliability"] >= min_reliability)
+    
+    if conditions:
+        node_ids = grid_node_table["id"][np.logical_and.reduce(conditions)].tolist()
+    else:
+        node_ids = list(node_json_by_id)
+    filters_applied = {
+        "region": region,
+        "state": state,
+        "min_clean_gen": min_clean_gen,
+        "min_transmission": min_transmission,
+        "min_reliability": min_reliability
     }
+    
+    # Splice the pre-encoded nodes into the response body, skipping dict
+    # assembly and FastAPI's response encoding
+    rows = [node_json_by_id[node_id] for node_id in node_ids]
+    tail = b'],"total":%d,"filters_applied":%s}' % (len(node_ids), orjson.dumps(filters_applied))
+    
+    if len(rows) >= STREAM_MIN_NODES:
+        return _stream_rows_response(b'{"nodes":[', rows, tail)
+    
+    return Response(content=b'{"nodes":[' + b",".join(rows) + tail, media_type="application/json")
 
 
 @app.get("/api/grid/nodes/geojson")
 async def get_grid_nodes_geojson(
+    request: Request,
     region: Optional[str] = None,
     state: Optional[str] = None
 ):
@@ -279,26 +696,51 @@ async def get_grid_nodes_geojson(
     
     Optimized for map rendering with essential properties only.
     """
-    nodes = grid_nodes
+    if not region and not state:
+        return _json_body_response(request, all_nodes_geojson_body)
     
-    # Apply filters
-    if region:
-        nodes = [n for n in nodes if n.region == region]
+    cache_key = (region, state)
+    body = nodes_geojson_cache.get(cache_key)
+    if body is not None:
+        return _json_body_response(request, body)
     
+    # Filter on the node columns and pick the matching cached features
+    mask = np.ones(len(node_feature_rows), dtype=bool)
+    if region:
+        mask &= grid_node_table["region"] == region
     if state:
-        nodes = [n for n in nodes if n.state == state]
-    
-    # Convert to GeoJSON
-    features = [n.to_geojson_feature() for n in nodes]
+        mask &= grid_node_table["state"] == state
+    
+    # The cached features were validated when the unfiltered collection was
+    # built, so their encoded forms are spliced in directly
+    rows = [node_feature_rows[i] for i in np.flatnonzero(mask).tolist()]
+    head = b'{"type":"FeatureCollection","features":['
+    tail = b'],"metadata":%s}' % orjson.dumps({
+        "total_nodes": len(rows),
+        "region_filter": region,
+        "state_filter": state
+    })
+    
+    # Unknown region/state values match nothing; those bodies are not kept
+    if not rows:
+        return Response(content=head + tail, media_type="application/json")
+    
+    body = _encode_body(head + b",".join(rows) + tail)
+    if len(nodes_geojson_cache) >= NODES_GEOJSON_CACHE_SIZE:
+        nodes_geojson_cache.pop(next(iter(nodes_geojson_cache)))
+    nodes_geojson_cache[cache_key] = body
+    return _json_body_response(request, body)
+
+
+@lru_cache(maxsize=None)
+def _grid_node_body(node_id: int) -> bytes:
+    """
+    Encoded /api/grid/nodes/{node_id} body for a reference node.
     
-    return GeoJSONResponse(
-        features=features,
-        metadata={
-            "total_nodes": len(features),
-            "region_filter": region,
-            "state_filter": state
-        }
-    )
+    Reference nodes come from the static mock data (get_node_by_id), so each
+    is encoded once; unknown IDs raise ValueError and are not cached.
+    """
+    return orjson.dumps({"node": get_node_by_id(node_id).model_dump()})
 
 
 @app.get("/api/grid/nodes/{node_id}")
@@ -307,30 +749,23 @@ async def get_grid_node(node_id: int):
     Get detailed information for a specific grid node.
     """
     try:
-        node = get_node_by_id(node_id)
-        return {"node": node.dict()}
+        body = _grid_node_body(node_id)
     except ValueError:
         raise HTTPException(status_code=404, detail=f"Grid node {node_id} not found")
+    
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/grid/regions")
-async def get_regions():
+async def get_regions(request: Request):
     """Get list of available regions"""
-    regions = list(set(n.region for n in grid_nodes if n.region))
-    return {
-        "regions": sorted(regions),
-        "total": len(regions)
-    }
+    return _json_body_response(request, regions_body)
 
 
 @app.get("/api/grid/states")
-async def get_states():
+async def get_states(request: Request):
     """Get list of available states"""
-    states = list(set(n.state for n in grid_nodes if n.state))
-    return {
-        "states": sorted(states),
-        "total": len(states)
-    }
+    return _json_body_response(request, states_body)
 
 
 # ============================================================================
@@ -355,24 +790,26 @@ async def get_power_plants(
     if not power_plants:
         raise HTTPException(status_code=503, detail="Power plant data not available")
     
-    # Apply filters
-    filtered = filter_power_plants(
-        power_plants,
-        fuel_category=fuel_category,
-        min_capacity_mw=min_capacity_mw,
-        max_capacity_mw=max_capacity_mw,
-        renewable_only=renewable_only,
-        clean_only=clean_only
-    )
+    # Apply filters on the plant columns
+    indices = _filtered_plant_indices(_plant_filter_key(
+        [fuel_category] if fuel_category else None,
+        min_capacity_mw,
+        max_capacity_mw,
+        renewable_only,
+        clean_only
+    ))
     
     # Apply limit
     if limit:
-        filtered = filtered[:limit]
-    
-    return {
-        "plants": [p.dict() for p in filtered],
-        "total": len(filtered),
-        "total_capacity_mw": round(sum(p.nameplate_mw for p in filtered), 1),
+        indices = indices[:limit]
+    
+    # Splice the pre-encoded plant objects into the response body; the rest
+    # of the document is small and encoded per request
+    rows = power_plant_json_rows
+    tail = orjson.dumps({
+        "total": len(indices),
+        # Python sum keeps the same (sequential) rounding as before
+        "total_capacity_mw": round(sum(power_plant_table["nameplate_mw"][indices].tolist()), 1),
         "filters_applied": {
             "fuel_category": fuel_category,
             "min_capacity_mw": min_capacity_mw,
@@ -381,11 +818,89 @@ async def get_power_plants(
             "clean_only": clean_only,
             "limit": limit
         }
-    }
+    })
+    body = b'{"plants":[' + b",".join([rows[i] for i in indices.tolist()]) + b"]," + tail[1:]
+    
+    return Response(content=body, media_type="application/json")
+
+
+def _plant_filter_key(
+    fuel_categories: Optional[List[str]],
+    min_capacity_mw: float,
+    max_capacity_mw: float,
+    renewable_only: bool,
+    clean_only: bool
+) -> tuple:
+    """Normalized power plant filter parameters, used as a cache key"""
+    return (
+        tuple(sorted(set(fuel_categories))) if fuel_categories else None,
+        min_capacity_mw,
+        max_capacity_mw,
+        renewable_only,
+        # clean_only is ignored when renewable_only is set
+        clean_only and not renewable_only
+    )
+
+
+def _filtered_plant_indices(key: tuple) -> np.ndarray:
+    """
+    Indices of the power plants matching a _plant_filter_key() filter.
+    
+    Results are cached until the next reload, so the table and map views
+    of the same filter only pay for the filter pass once. The returned
+    array is shared and read-only.
+    """
+    indices = power_plant_index_cache.get(key)
+    if indices is not None:
+        return indices
+    
+    fuel_categories, min_capacity_mw, max_capacity_mw, renewable_only, clean_only = key
+    indices = filter_plant_indices(
+        power_plant_table,
+        fuel_categories=list(fuel_categories) if fuel_categories else None,
+        min_capacity_mw=min_capacity_mw,
+        max_capacity_mw=max_capacity_mw,
+        renewable_only=renewable_only,
+        clean_only=clean_only
+    )
+    indices.setflags(write=False)
+    
+    if len(power_plant_index_cache) >= POWER_PLANT_INDEX_CACHE_SIZE:
+        # Also filled from worker threads; tolerate another thread evicting first
+        power_plant_index_cache.pop(next(iter(power_plant_index_cache), None), None)
+    power_plant_index_cache[key] = indices
+    return indices
+
+
+def _plant_feature_rows() -> List[bytes]:
+    """Encoded GeoJSON feature per power plant, built on first use after each reload"""
+    global power_plant_feature_rows
+    
+    if power_plant_feature_rows is None:
+        power_plant_feature_rows = [orjson.dumps(f) for f in power_plant_features(power_plants)]
+    return power_plant_feature_rows
+
+
+def _power_plants_geojson_body(filter_key: tuple) -> bytes:
+    """
+    Filter the power plants and encode them as a GeoJSON FeatureCollection.
+    
+    Features are spliced in from power_plant_feature_rows (each plant encoded
+    once, on first use) and metadata comes from the plant columns, so the
+    collection is never materialized as Python dicts.
+    """
+    rows = _plant_feature_rows()
+    indices = _filtered_plant_indices(filter_key)
+    
+    return b'{"type":"FeatureCollection","features":[%s],"metadata":%s}' % (
+        b",".join([rows[i] for i in indices.tolist()]),
+        orjson.dumps(geojson_metadata_from_table(power_plant_table, indices))
+    )
 
 
 @app.get("/api/power-plants/geojson")
 async def get_power_plants_geojson(
+    request: Request,
     fuel_category: Optional[List[str]] = Query(None, description="Filter by fuel categories (can specify multiple)"),
     min_capacity_mw: float = Query(0, ge=0),
     max_capacity_mw: float = Query(10000, ge=0),
@@ -401,24 +916,111 @@ async def get_power_plants_geojson(
     if not power_plants:
         raise HTTPException(status_code=503, detail="Power plant data not available")
     
-    # Apply filters
-    filtered = filter_power_plants(
-        power_plants,
+    # The plant list only changes on reload, so identical filters always
+    # produce the same body; serve it from the cache when possible
+    cache_key = _plant_filter_key(
+        fuel_category,
+        min_capacity_mw,
+        max_capacity_mw,
+        renewable_only,
+        clean_only
+    )
+    body = power_plants_geojson_cache.get(cache_key)
+    if body is not None:
+        return _json_body_response(request, body)
+    
+    # Join a build already running for this filter, or start one; shielded
+    # so a disconnecting client does not cancel it for the others
+    build = power_plants_geojson_builds.get(cache_key)
+    if build is None:
+        build = asyncio.create_task(_build_power_plants_geojson(cache_key))
+        power_plants_geojson_builds[cache_key] = build
+    body = await asyncio.shield(build)
+    
+    return _json_body_response(request, body)
+
+
+async def _build_power_plants_geojson(cache_key: tuple) -> EncodedBody:
+    """
+    Build and cache the /api/power-plants/geojson body for a filter key.
+    
+    Runs as a task shared by concurrent requests for the same filter (see
+    power_plants_geojson_builds), and removes itself from there when done.
+    """
+    plants = power_plants
+    try:
+        # Building the collection is CPU-bound; keep it off the event loop
+        content, etag = await asyncio.to_thread(
+            lambda: _encode_body(_power_plants_geojson_body(cache_key))
+        )
+    finally:
+        if power_plants_geojson_builds.get(cache_key) is asyncio.current_task():
+            del power_plants_geojson_builds[cache_key]
+    body = content, etag
+    
+    # A reload while building makes the body stale for later requests
+    if plants is not power_plants:
+        return body
+    
+    # Evict oldest entries until the new body fits both limits; a body
+    # larger than the whole byte budget is served but not cached
+    if len(content) <= POWER_PLANTS_GEOJSON_CACHE_BYTES:
+        cached_bytes = sum(len(cached[0]) for cached in power_plants_geojson_cache.values())
+        while power_plants_geojson_cache and (
+            len(power_plants_geojson_cache) >= POWER_PLANTS_GEOJSON_CACHE_SIZE
+            or cached_bytes + len(content) > POWER_PLANTS_GEOJSON_CACHE_BYTES
+        ):
+            evicted = power_plants_geojson_cache.pop(next(iter(power_plants_geojson_cache)))
+            cached_bytes -= len(evicted[0])
+        power_plants_geojson_cache[cache_key] = body
+    
+    return body
+
+
+@app.get("/api/power-plants/tiles/{z}/{x}/{y}")
+async def get_power_plants_tile(
+    z: int = Path(..., ge=0, le=22),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+    fuel_category: Optional[List[str]] = Query(None, description="Filter by fuel categories (can specify multiple)"),
+    min_capacity_mw: float = Query(0, ge=0),
+    max_capacity_mw: float = Query(10000, ge=0),
+    renewable_only: bool = Query(False),
+    clean_only: bool = Query(False)
+):
+    """
+    Get the power plants inside one XYZ map tile as a GeoJSON FeatureCollection.
+    
+    Lets the map load only the visible area instead of the full
+    /api/power-plants/geojson collection. Takes the same filters.
+    """
+    if not power_plants:
+        raise HTTPException(status_code=503, detail="Power plant data not available")
+    
+    if x >= 2 ** z or y >= 2 ** z:
+        raise HTTPException(status_code=404, detail=f"Tile {z}/{x}/{y} does not exist")
+    
+    # The first request after startup or a reload encodes every plant; keep
+    # that off the event loop
+    rows = power_plant_feature_rows
+    if rows is None:
+        rows = await asyncio.to_thread(_plant_feature_rows)
+    indices = filter_plant_indices(
+        power_plant_table,
         fuel_categories=fuel_category,
         min_capacity_mw=min_capacity_mw,
         max_capacity_mw=max_capacity_mw,
         renewable_only=renewable_only,
-        clean_only=clean_only
+        clean_only=clean_only,
+        bounds=tile_bounds(z, x, y)
     )
     
-    # Convert to GeoJSON with metadata
-    geojson = power_plants_to_geojson(filtered, include_metadata=True)
-    
-    return geojson
+    body = b'{"type":"FeatureCollection","features":[%s]}' % b",".join([rows[i] for i in indices.tolist()])
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/power-plants/stats")
-async def get_power_plants_stats():
+async def get_power_plants_stats(request: Request):
     """
     Get statistics about power plants by fuel category.
     
@@ -427,25 +1029,11 @@ async def get_power_plants_stats():
     if not power_plants:
         raise HTTPException(status_code=503, detail="Power plant data not available")
     
-    stats = get_fuel_category_stats(power_plants)
-    
-    # Calculate totals
-    total_plants = len(power_plants)
-    renewable_count = sum(p.is_renewable() for p in power_plants)
-    clean_count = sum(p.is_clean() for p in power_plants)
-    
-    return {
-        "total_plants": total_plants,
-        "renewable_count": renewable_count,
-        "renewable_percentage": round(renewable_count / total_plants * 100, 1),
-        "clean_count": clean_count,
-        "clean_percentage": round(clean_count / total_plants * 100, 1),
-        "by_fuel_category": stats
-    }
+    return _json_body_response(request, power_plant_stats_body)
 
 
 @app.get("/api/power-plants/fuel-categories")
-async def get_fuel_categories():
+async def get_fuel_categories(request: Request):
     """
     Get list of available fuel categories with colors.
     
@@ -454,36 +1042,16 @@ async def get_fuel_categories():
     if not power_plants:
         raise HTTPException(status_code=503, detail="Power plant data not available")
     
-    from models import get_fuel_category_color, get_fuel_category_icon
-    
-    # Get unique categories
-    categories = list(set(p.primary_fuel_category for p in power_plants))
-    
-    # Build response with colors and counts
-    result = []
-    for category in sorted(categories):
-        count = sum(1 for p in power_plants if p.primary_fuel_category == category)
-        total_capacity = sum(p.nameplate_mw for p in power_plants if p.primary_fuel_category == category)
-        
-        result.append({
-            "category": category,
-            "color": get_fuel_category_color(category),
-            "icon": get_fuel_category_icon(category),
-            "count": count,
-            "total_capacity_mw": round(total_capacity, 1)
-        })
-    
-    return {
-        "fuel_categories": result,
-        "total": len(result)
-    }
+    return _json_body_response(request, fuel_categories_body)
 
 
 # ============================================================================
 # SITING EVALUATION ENDPOINTS
 # ============================================================================
 
-@app.post("/api/siting/evaluate")
+# The engine returns an already-validated SiteEvaluation; response_model=None
+# keeps FastAPI from validating it again before encoding
+@app.post("/api/siting/evaluate", response_model=None)
 async def evaluate_site(request: SitingRequest) -> SiteEvaluation:
     """
     Evaluate a site with custom criteria weights.
@@ -498,8 +1066,9 @@ async def evaluate_site(request: SitingRequest) -> SiteEvaluation:
         weights = request.to_weights()
         demand_profile = request.to_demand_profile()
         
-        # Evaluate the site
-        evaluation = siting_engine.evaluate_site(
+        # Evaluate the site (CPU-bound; run off the event loop)
+        evaluation = await asyncio.to_thread(
+            siting_engine.evaluate_site,
             node=node,
             weights=weights,
             demand_profile=demand_profile,
@@ -508,8 +1077,8 @@ async def evaluate_site(request: SitingRequest) -> SiteEvaluation:
         )
         
         logger.info(
-            f"Evaluated site {request.site_id} ({node.name}): "
-            f"score={evaluation.score_breakdown.composite_score:.1f}"
+            "Evaluated site %s (%s): score=%.1f",
+            request.site_id, node.name, evaluation.score_breakdown.composite_score
         )
         
         return evaluation
@@ -538,8 +1107,10 @@ async def evaluate_location(request: LocationEvaluationRequest):
         weights = request.to_weights()
         demand_profile = request.to_demand_profile()
         
-        # Calculate scores dynamically from coordinates
-        score_breakdown = siting_engine.calculate_scores_from_coordinates(
+        # Calculate scores dynamically from coordinates (CPU-bound; run off
+        # the event loop so concurrent map clicks are not serialized)
+        score_breakdown = await asyncio.to_thread(
+            siting_engine.calculate_scores_from_coordinates,
             latitude=request.latitude,
             longitude=request.longitude,
             energy_sources=energy_sources,
@@ -563,26 +1134,30 @@ async def evaluate_location(request: LocationEvaluationRequest):
             region="Custom Location",
             state=None,
             balancing_authority=None,
-            nearby_projects=[],
-            transmission_lines=[]
+            nearby_projects=(),
+            transmission_lines=()
         )
         
         # Find nearby power plants for context
         nearby_power_plants = []
-        logger.info(f"Power plants available: {len(power_plants) if power_plants else 0}")
+        logger.debug("Power plants available: %d", len(power_plants) if power_plants else 0)
         
         if not power_plants:
             logger.error("No power plants loaded! This should not happen after startup.")
             # Still return evaluation, but with empty nearby plants
         elif len(power_plants) > 0:
-            logger.info(f"Finding nearby power plants for location ({request.latitude:.3f}, {request.longitude:.3f}). Total plants available: {len(power_plants)}")
+            logger.debug(
+                "Finding nearby power plants for location (%.3f, %.3f). Total plants available: %d",
+                request.latitude, request.longitude, len(power_plants)
+            )
             try:
-                nearby_power_plants = siting_engine._find_nearby_power_plants(
+                nearby_power_plants = await asyncio.to_thread(
+                    siting_engine._find_nearby_power_plants,
                     request.latitude,
                     request.longitude,
                     power_plants
                 )
-                logger.info(f"Successfully found {len(nearby_power_plants)} nearby power plants")
+                logger.debug("Successfully found %d nearby power plants", len(nearby_power_plants))
             except Exception as e:
                 logger.error(f"Error finding nearby power plants: {e}", exc_info=True)
                 # Continue with empty list
@@ -606,8 +1181,8 @@ async def evaluate_location(request: LocationEvaluationRequest):
         )
         
         logger.info(
-            f"Evaluated custom location ({request.latitude:.3f}, {request.longitude:.3f}): "
-            f"score={score_breakdown.composite_score:.1f}"
+            "Evaluated custom location (%.3f, %.3f): score=%.1f",
+            request.latitude, request.longitude, score_breakdown.composite_score
         )
         
         return evaluation
@@ -619,33 +1194,89 @@ async def evaluate_location(request: LocationEvaluationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@lru_cache(maxsize=512)
+def _ranked_sites(weight_clean: float, weight_transmission: float, weight_reliability: float) -> Tuple[Tuple[GridNode, float], ...]:
+    """
+    Every grid node ranked under one weight triple, best first.
+    
+    Slider-driven dashboards repeat the same few triples, so full rankings
+    are memoized; slicing one gives the same result as rank_sites() with a
+    limit. Depends on grid_nodes, so _refresh_node_caches() clears it.
+    """
+    weights = get_siting_weights(weight_clean, weight_transmission, weight_reliability)
+    return tuple(siting_engine.rank_sites(grid_nodes, weights))
+
+
+@lru_cache(maxsize=512)
+def _ranking_rows(weight_clean: float, weight_transmission: float, weight_reliability: float) -> Tuple[bytes, ...]:
+    """
+    Encoded /api/siting/rankings entries for _ranked_sites(), rank included.
+    
+    Cleared together with _ranked_sites().
+    """
+    return tuple(
+        orjson.dumps({
+            "rank": i + 1,
+            "id": node.id,
+            "name": node.name,
+            "composite_score": score,
+            "clean_gen": node.clean_gen,
+            "transmission_headroom": node.transmission_headroom,
+            "reliability": node.reliability,
+            "region": node.region,
+            "state": node.state
+        })
+        for i, (node, score) in enumerate(
+            _ranked_sites(weight_clean, weight_transmission, weight_reliability)
+        )
+    )
+
+
+def query_weights(
+    weight_clean: float = Query(0.4, ge=0, le=1),
+    weight_transmission: float = Query(0.3, ge=0, le=1),
+    weight_reliability: float = Query(0.3, ge=0, le=1)
+) -> Tuple[SitingWeights, dict]:
+    """
+    Dependency resolving the weight query parameters.
+    
+    Returns:
+        Tuple of (validated SitingWeights, its serialized dict); the
+        SitingWeights instance is shared between requests (it is frozen)
+    
+    Raises:
+        HTTPException: 400 if the weights do not sum to 1.0
+    """
+    try:
+        weights = get_siting_weights(weight_clean, weight_transmission, weight_reliability)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return weights, weights.model_dump()
+
+
 @app.get("/api/siting/alternatives")
 async def get_alternative_sites(
     site_id: int,
-    weight_clean: float = Query(0.4, ge=0, le=1),
-    weight_transmission: float = Query(0.3, ge=0, le=1),
-    weight_reliability: float = Query(0.3, ge=0, le=1),
-    limit: int = Query(5, ge=1, le=20)
+    limit: int = Query(5, ge=1, le=20),
+    validated_weights: Tuple[SitingWeights, dict] = Depends(query_weights)
 ):
     """
     Get top N alternative sites ranked by composite score.
     
     Uses same weights as reference site for fair comparison.
     """
+    weights, weights_used = validated_weights
+    
     try:
-        # Validate weights
-        weights = SitingWeights(
-            weight_clean=weight_clean,
-            weight_transmission=weight_transmission,
-            weight_reliability=weight_reliability
-        )
-        weights.validate_sum()
-        
         # Get reference node
         reference_node = get_node_by_id(site_id)
         
-        # Rank all sites
-        ranked = siting_engine.rank_sites(grid_nodes, weights)
+        # Top sites from the cached ranking (one extra in case the
+        # reference is among them)
+        ranked = _ranked_sites(
+            weights.weight_clean, weights.weight_transmission, weights.weight_reliability
+        )[:limit + 1]
         
         # Filter out reference site and take top N
         alternatives = [
@@ -667,7 +1298,7 @@ async def get_alternative_sites(
             "reference_site_id": site_id,
             "reference_site_name": reference_node.name,
             "alternatives": alternatives,
-            "weights_used": weights.dict()
+            "weights_used": weights_used
         }
         
     except ValueError as e:
@@ -682,49 +1313,29 @@ async def get_alternative_sites(
 
 @app.get("/api/siting/rankings")
 async def get_site_rankings(
-    weight_clean: float = Query(0.4, ge=0, le=1),
-    weight_transmission: float = Query(0.3, ge=0, le=1),
-    weight_reliability: float = Query(0.3, ge=0, le=1),
-    limit: Optional[int] = Query(None, ge=1, le=50)
+    limit: Optional[int] = Query(None, ge=1, le=50),
+    validated_weights: Tuple[SitingWeights, dict] = Depends(query_weights)
 ):
     """
     Get all sites ranked by composite score.
     
     Useful for showing best overall sites across the country.
     """
+    weights, weights_used = validated_weights
+    
     try:
-        # Validate weights
-        weights = SitingWeights(
-            weight_clean=weight_clean,
-            weight_transmission=weight_transmission,
-            weight_reliability=weight_reliability
+        # Encoded entries from the cache (only the top N when limited),
+        # spliced into the response body
+        rows = _ranking_rows(
+            weights.weight_clean, weights.weight_transmission, weights.weight_reliability
+        )[:limit]
+        body = b'{"rankings":[%s],"total_sites":%d,"weights_used":%s}' % (
+            b",".join(rows),
+            len(grid_nodes),
+            orjson.dumps(weights_used)
         )
-        weights.validate_sum()
-        
-        # Rank all sites
-        ranked = siting_engine.rank_sites(grid_nodes, weights)
-        
-        # Format results
-        rankings = [
-            {
-                "rank": i + 1,
-                "id": node.id,
-                "name": node.name,
-                "composite_score": score,
-                "clean_gen": node.clean_gen,
-                "transmission_headroom": node.transmission_headroom,
-                "reliability": node.reliability,
-                "region": node.region,
-                "state": node.state
-            }
-            for i, (node, score) in enumerate(ranked[:limit] if limit else ranked)
-        ]
         
-        return {
-            "rankings": rankings,
-            "total_sites": len(grid_nodes),
-            "weights_used": weights.dict()
-        }
+        return Response(content=body, media_type="application/json")
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -733,6 +1344,24 @@ async def get_site_rankings(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/siting/cache/invalidate")
+async def invalidate_ranking_cache():
+    """
+    Drop all cached site rankings.
+    
+    Rankings are recomputed on their next request. Reloading data already
+    does this; the endpoint is for out-of-band changes to grid nodes.
+    """
+    cached = _ranked_sites.cache_info().currsize
+    _ranked_sites.cache_clear()
+    _ranking_rows.cache_clear()
+    
+    return {
+        "status": "cleared",
+        "rankings_deleted": cached
+    }
+
+
 # ============================================================================
 # SCENARIO MANAGEMENT ENDPOINTS
 # ============================================================================
@@ -742,18 +1371,23 @@ async def save_scenario(evaluation: SiteEvaluation):
     """
     Save a site evaluation for later comparison.
     
-    Stores evaluation in memory (for demo; use DB in production).
+    Stores evaluation in memory (for demo; use DB in production). Only the
+    most recent MAX_SAVED_SCENARIOS are kept.
     """
-    saved_scenarios.append(evaluation)
+    global saved_scenarios_first_id
+    
+    if len(saved_scenarios) == MAX_SAVED_SCENARIOS:
+        saved_scenarios_first_id += 1
+    saved_scenarios.append((evaluation, orjson.dumps(evaluation.model_dump())))
     
     logger.info(
-        f"Saved scenario for site {evaluation.site.id} "
-        f"(score={evaluation.score_breakdown.composite_score:.1f})"
+        "Saved scenario for site %s (score=%.1f)",
+        evaluation.site.id, evaluation.score_breakdown.composite_score
     )
     
     return {
         "status": "saved",
-        "scenario_id": len(saved_scenarios) - 1,
+        "scenario_id": saved_scenarios_first_id + len(saved_scenarios) - 1,
         "total_saved": len(saved_scenarios)
     }
 
@@ -761,10 +1395,12 @@ async def save_scenario(evaluation: SiteEvaluation):
 @app.get("/api/siting/scenarios")
 async def get_saved_scenarios():
     """Get all saved scenarios"""
-    return {
-        "scenarios": [s.dict() for s in saved_scenarios],
-        "total": len(saved_scenarios)
-    }
+    # Scenarios are encoded once when saved; listing just joins the bytes
+    body = b'{"scenarios":[%s],"total":%d}' % (
+        b",".join(encoded for _, encoded in saved_scenarios),
+        len(saved_scenarios)
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/api/siting/scenarios/compare")
@@ -780,25 +1416,32 @@ async def compare_scenarios(
     if not scenario_ids:
         raise HTTPException(status_code=400, detail="Must provide at least one scenario ID")
     
-    # Validate IDs
-    if any(sid >= len(saved_scenarios) or sid < 0 for sid in scenario_ids):
+    # Validate IDs (evicted scenarios are no longer available)
+    first_id = saved_scenarios_first_id
+    if any(sid >= first_id + len(saved_scenarios) or sid < first_id for sid in scenario_ids):
         raise HTTPException(status_code=404, detail="Invalid scenario ID")
     
     # Get evaluations
-    evaluations = [saved_scenarios[sid] for sid in scenario_ids]
+    evaluations = [saved_scenarios[sid - first_id][0] for sid in scenario_ids]
     
     # Compare
     comparison = siting_engine.compare_scenarios(evaluations, scenario_name)
     
-    return comparison.dict()
+    return comparison.model_dump()
 
 
 @app.delete("/api/siting/scenarios/clear")
 async def clear_saved_scenarios():
-    """Clear all saved scenarios"""
-    global saved_scenarios
+    """
+    Clear all saved scenarios.
+    
+    IDs keep counting from where they were, so an ID handed out before the
+    clear can never resolve to a scenario saved after it.
+    """
+    global saved_scenarios_first_id
     count = len(saved_scenarios)
-    saved_scenarios = []
+    saved_scenarios.clear()
+    saved_scenarios_first_id += count
     
     return {
         "status": "cleared",
@@ -821,43 +1464,29 @@ async def get_energy_sources(
     
     Returns energy project data with coordinates and capacity.
     """
-    filtered_sources = energy_sources.copy()
+    # Apply filters as one boolean mask over the source columns
+    mask = np.ones(len(energy_source_dicts), dtype=bool)
     
     # Filter by energy type
     if energy_type:
-        filtered_sources = [
-            s for s in filtered_sources
-            if s.energy_source.lower() == energy_type.lower()
-        ]
+        mask &= energy_source_types == energy_type.lower()
     
     # Filter by minimum capacity
     if min_capacity is not None:
-        filtered_sources = [
-            s for s in filtered_sources
-            if s.ppa_capacity_mw >= min_capacity
-        ]
+        mask &= energy_source_capacity_mw >= min_capacity
+    
+    indices = np.flatnonzero(mask)
     
     # Limit results
     if limit:
-        filtered_sources = filtered_sources[:limit]
+        indices = indices[:limit]
+    
+    indices = indices.tolist()
     
     return {
-        "sources": [
-            {
-                "name": s.name,
-                "energy_source": s.energy_source,
-                "capacity_mw": s.ppa_capacity_mw,
-                "address": s.address,
-                "coordinates": {
-                    "latitude": s.coordinates.latitude,
-                    "longitude": s.coordinates.longitude
-                } if s.coordinates else None,
-                "clean_multiplier": s.get_clean_multiplier()
-            }
-            for s in filtered_sources
-        ],
-        "total": len(filtered_sources),
-        "total_capacity_mw": sum(s.ppa_capacity_mw for s in filtered_sources),
+        "sources": [energy_source_dicts[i] for i in indices],
+        "total": len(indices),
+        "total_capacity_mw": sum(energy_source_dicts[i]["capacity_mw"] for i in indices),
         "filters_applied": {
             "energy_type": energy_type,
             "min_capacity": min_capacity,
@@ -867,96 +1496,17 @@ async def get_energy_sources(
 
 
 @app.get("/api/energy-sources/geojson")
-async def get_energy_sources_geojson():
+async def get_energy_sources_geojson(request: Request):
     """
     Get energy sources as GeoJSON FeatureCollection for map visualization.
     """
-    features = []
-    
-    # Hardcoded energy source coordinates (pre-geocoded)
-    hardcoded_sources = [
-        {"name": "360 Solar", "address": "21501 Hull Street Road, Mosley, VA", "lat": 37.4019, "lon": -77.5311, "capacity": 52, "type": "Solar"},
-        {"name": "Wythe County", "address": "Foster Falls Road, Suffolk, VA", "lat": 36.9204, "lon": -76.5833, "capacity": 52, "type": "Solar"},
-        {"name": "Waterloo Solar", "address": "Bastrop County, Texas", "lat": 30.0000, "lon": -97.1167, "capacity": 52, "type": "Solar"},
-        {"name": "Switchgrass", "address": "Hoosier Road, Suffolk, VA", "lat": 36.7286, "lon": -76.5833, "capacity": 52, "type": "Solar"},
-        {"name": "Lafitte Solar Park", "address": "343 McHenry Gin Rd., Monroe, LA 71202", "lat": 32.5093, "lon": -92.1221, "capacity": 52, "type": "Solar"},
-        {"name": "Harrisonburg", "address": "3793 Kratzer Road, Harrisonburg, VA", "lat": 38.4496, "lon": -78.8689, "capacity": 52, "type": "Solar"},
-        {"name": "Groves", "address": "Westmoreland County, VA", "lat": 38.0293, "lon": -76.8803, "capacity": 52, "type": "Solar"},
-        {"name": "Bluestem", "address": "LaPorte County, Indiana", "lat": 41.6094, "lon": -86.7326, "capacity": 52, "type": "Battery Storage + Solar"},
-        {"name": "Big Pine", "address": "Sussex County, Virginia", "lat": 36.8468, "lon": -77.2803, "capacity": 52, "type": "Solar"},
-    ]
-    
-    # If energy sources loaded from file
-    if energy_sources:
-        for source in energy_sources:
-            if source.coordinates:  # Only include geocoded sources
-                try:
-                    features.append(source.to_geojson_feature())
-                except Exception as e:
-                    logger.warning(f"Failed to convert {source.name} to GeoJSON: {e}")
-    
-    # Fallback: Use hardcoded coordinates if no sources loaded
-    if not features:
-        logger.info("Using hardcoded energy source coordinates")
-        
-        for source in hardcoded_sources:
-            features.append({
-                "type": "Feature",
-                "properties": {
-                    "name": source["name"],
-                    "energy_source": source["type"],
-                    "capacity_mw": source["capacity"],
-                    "address": source["address"],
-                    "clean_multiplier": 1.0 if "solar" in source["type"].lower() else 0.95,
-                },
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [source["lon"], source["lat"]]  # [longitude, latitude]
-                }
-            })
-    
-    return {
-        "type": "FeatureCollection",
-        "features": features,
-        "metadata": {
-            "total_sources": len(hardcoded_sources),
-            "geocoded_sources": len(features),
-            "total_capacity_mw": sum(f["properties"]["capacity_mw"] for f in features) if features else 468
-        }
-    }
+    return _json_body_response(request, energy_sources_geojson_body)
 
 
 @app.get("/api/energy-sources/stats")
-async def get_energy_source_stats():
+async def get_energy_source_stats(request: Request):
     """Get statistics about loaded energy sources"""
-    if not energy_sources:
-        return {
-            "total_sources": 0,
-            "total_capacity_mw": 0,
-            "by_type": {},
-            "geocoded_count": 0,
-            "using_real_scores": False
-        }
-    
-    # Count by energy type
-    by_type = {}
-    for source in energy_sources:
-        energy_type = source.energy_source
-        if energy_type not in by_type:
-            by_type[energy_type] = {"count": 0, "capacity_mw": 0}
-        by_type[energy_type]["count"] += 1
-        by_type[energy_type]["capacity_mw"] += source.ppa_capacity_mw
-    
-    geocoded_count = sum(1 for s in energy_sources if s.coordinates is not None)
-    
-    return {
-        "total_sources": len(energy_sources),
-        "total_capacity_mw": sum(s.ppa_capacity_mw for s in energy_sources),
-        "by_type": by_type,
-        "geocoded_count": geocoded_count,
-        "geocoding_rate": f"{(geocoded_count / len(energy_sources) * 100):.1f}%" if energy_sources else "0%",
-        "using_real_scores": len(energy_sources) > 0
-    }
+    return _json_body_response(request, energy_source_stats_body)
 
 
 @app.post("/api/energy-sources/reload")
@@ -966,7 +1516,7 @@ async def reload_energy_sources():
     
     Useful for updating data without restarting the server.
     """
-    global energy_sources, grid_nodes
+    global energy_sources, grid_nodes, power_plants
     
     try:
         from energy_sources import load_energy_sources
@@ -979,12 +1529,19 @@ async def reload_energy_sources():
         power_plants = get_all_power_plants(reload=True)
         logger.info(f"Reloaded {len(power_plants)} power plants")
         
+        # Normalization factors were estimated from the previous datasets
+        invalidate_normalization_cache()
+        
         # Recalculate grid node scores (both clean_gen and transmission)
         logger.info("Recalculating grid node scores (clean_gen + transmission)...")
         grid_nodes = generate_grid_nodes_with_real_scores(
             energy_sources=energy_sources,
             power_plants=power_plants
         )
+        _refresh_node_caches()
+        _refresh_plant_caches()
+        _refresh_source_caches()
+        _refresh_health_response()
         logger.info(f"Updated {len(grid_nodes)} grid nodes")
         
         return {
@@ -1015,9 +1572,8 @@ async def get_nearby_sources_for_node(
     Returns sources sorted by distance.
     """
     # Get the node
-    try:
-        node = get_node_by_id(node_id, grid_nodes)
-    except ValueError:
+    node = grid_nodes_by_id.get(node_id)
+    if node is None:
         raise HTTPException(status_code=404, detail=f"Grid node {node_id} not found")
     
     if not energy_sources:
@@ -1032,24 +1588,11 @@ async def get_nearby_sources_for_node(
     try:
         from scoring_utils import find_nearby_sources
         
-        # Prepare source data
-        source_data = [
-            (
-                s.name,
-                s.coordinates.latitude,
-                s.coordinates.longitude,
-                s.ppa_capacity_mw,
-                s.energy_source
-            )
-            for s in energy_sources
-            if s.coordinates is not None
-        ]
-        
         # Find nearby sources
         nearby = find_nearby_sources(
             node.coordinates.latitude,
             node.coordinates.longitude,
-            source_data,
+            energy_source_rows,
             max_distance_km=max_distance_km,
             limit=limit
         )
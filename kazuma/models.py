@@ -4,16 +4,27 @@ Pydantic Models for Smart Grid Siting Framework
 Defines data structures for grid nodes, siting criteria, evaluations, and scenario comparisons.
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, List, Dict, Any, Literal, Tuple
 from datetime import datetime
-import math
+from functools import lru_cache
+import sys
 
 
 # ============================================================================
 # POWER PLANT MODELS
 # ============================================================================
 
+# Only WND, SUN, WAT, GEO fuels (and their categories) count as renewable
+RENEWABLE_FUELS = frozenset({"WND", "SUN", "WAT", "GEO"})
+RENEWABLE_CATEGORIES = frozenset({"WIND", "SOLAR", "HYDRO", "GEOTHERMAL"})
+
+
+def _is_renewable_fuel(primary_fuel: str, fuel_category: str) -> bool:
+    """Renewable test shared by PowerPlant.is_renewable() and power_plant_features()"""
+    return primary_fuel in RENEWABLE_FUELS or fuel_category in RENEWABLE_CATEGORIES
+
+
 class PowerPlant(BaseModel):
     """
     US Power Plant from eGRID database.
@@ -32,11 +43,7 @@ class PowerPlant(BaseModel):
     
     def is_renewable(self) -> bool:
         """Check if plant uses renewable energy source (WIND, SOLAR, HYDRO, GEOTHERMAL only)"""
-        # Only WND, SUN, WAT, GEO are considered clean energy sources
-        renewable_fuels = {"WND", "SUN", "WAT", "GEO"}
-        renewable_categories = {"WIND", "SOLAR", "HYDRO", "GEOTHERMAL"}
-        return (self.primary_fuel in renewable_fuels or 
-                self.primary_fuel_category in renewable_categories)
+        return _is_renewable_fuel(self.primary_fuel, self.primary_fuel_category)
     
     def is_clean(self) -> bool:
         """Check if plant is clean energy (same as renewable - WND, SUN, WAT, GEO only)"""
@@ -49,25 +56,27 @@ class PowerPlant(BaseModel):
     
     def to_geojson_feature(self) -> Dict[str, Any]:
         """Convert power plant to GeoJSON feature for Mapbox visualization"""
-        return {
-            "type": "Feature",
-            "id": self.oris_code,
-            "properties": {
-                "oris_code": self.oris_code,
-                "plant_name": self.plant_name,
-                "primary_fuel": self.primary_fuel,
-                "primary_fuel_category": self.primary_fuel_category,
-                "nameplate_mw": round(self.nameplate_mw, 1),
-                "annual_net_gen_mwh": round(self.annual_net_gen_mwh, 0),
-                "is_renewable": self.is_renewable(),
-                "is_clean": self.is_clean(),
-                "fuel_color": self.get_fuel_color(),
-            },
-            "geometry": {
-                "type": "Point",
-                "coordinates": [self.longitude, self.latitude]
-            }
-        }
+        # The feature schema is defined once, in power_plant_features()
+        return power_plant_features([self])[0]
+
+
+FUEL_CATEGORY_COLORS = {
+    # Clean energy sources (green/blue palette)
+    "SOLAR": "#22c55e",      # Green-500
+    "WIND": "#10b981",       # Emerald-500
+    "HYDRO": "#0ea5e9",      # Sky-500
+    "GEOTHERMAL": "#84cc16", # Lime-500
+    
+    # Non-clean sources (warm/distinct colors)
+    "BIOMASS": "#f59e0b",    # Amber-500
+    "NUCLEAR": "#8b5cf6",    # Violet-500
+    "GAS": "#f97316",        # Orange-500
+    "COAL": "#ef4444",       # Red-500
+    "OIL": "#dc2626",        # Red-600
+    "OFSL": "#fb923c",       # Orange-400
+    "OTHF": "#a855f7",       # Purple-500
+}
+DEFAULT_FUEL_COLOR = "#6b7280"  # Gray-500
 
 
 def get_fuel_category_color(fuel_category: str) -> str:
@@ -77,23 +86,25 @@ def get_fuel_category_color(fuel_category: str) -> str:
     Clean energy sources get vibrant green/blue colors.
     Non-clean sources get distinct warm colors for visibility.
     """
-    color_map = {
-        # Clean energy sources (green/blue palette)
-        "SOLAR": "#22c55e",      # Green-500
-        "WIND": "#10b981",       # Emerald-500
-        "HYDRO": "#0ea5e9",      # Sky-500
-        "GEOTHERMAL": "#84cc16", # Lime-500
-        
-        # Non-clean sources (warm/distinct colors)
-        "BIOMASS": "#f59e0b",    # Amber-500
-        "NUCLEAR": "#8b5cf6",    # Violet-500
-        "GAS": "#f97316",        # Orange-500
-        "COAL": "#ef4444",       # Red-500
-        "OIL": "#dc2626",        # Red-600
-        "OFSL": "#fb923c",       # Orange-400
-        "OTHF": "#a855f7",       # Purple-500
-    }
-    return color_map.get(fuel_category, "#6b7280")  # Default: Gray-500
+    return FUEL_CATEGORY_COLORS.get(fuel_category, DEFAULT_FUEL_COLOR)
+
+
+FUEL_CATEGORY_ICONS = {
+    # Clean energy sources
+    "SOLAR": "☀️",
+    "WIND": "💨",
+    "HYDRO": "💧",
+    "GEOTHERMAL": "🌋",
+    
+    # Non-clean energy sources
+    "BIOMASS": "🌾",
+    "NUCLEAR": "⚛️",
+    "GAS": "🔥",
+    "COAL": "⛏️",
+    "OIL": "🛢️",
+    "OFSL": "⚡",
+    "OTHF": "⚙️",
+}
 
 
 def get_fuel_category_icon(fuel_category: str) -> str:
@@ -101,23 +112,54 @@ def get_fuel_category_icon(fuel_category: str) -> str:
     Get emoji/icon for fuel category (for UI display).
     Clean energy sources have nature icons, non-clean have industrial icons.
     """
-    icon_map = {
-        # Clean energy sources
-        "SOLAR": "☀️",
-        "WIND": "💨",
-        "HYDRO": "💧",
-        "GEOTHERMAL": "🌋",
-        
-        # Non-clean energy sources
-        "BIOMASS": "🌾",
-        "NUCLEAR": "⚛️",
-        "GAS": "🔥",
-        "COAL": "⛏️",
-        "OIL": "🛢️",
-        "OFSL": "⚡",
-        "OTHF": "⚙️",
-    }
-    return icon_map.get(fuel_category, "⚡")
+    return FUEL_CATEGORY_ICONS.get(fuel_category, "⚡")
+
+
+def power_plant_features(plants: List[PowerPlant]) -> List[Dict[str, Any]]:
+    """
+    GeoJSON features for Mapbox visualization, one per plant.
+    
+    Reads each plant's fields once and builds the features from plain tuples,
+    skipping per-plant method calls. PowerPlant.to_geojson_feature() uses it
+    too, so this is the only definition of the feature schema. Clean is the
+    same test as renewable, so it is evaluated once.
+    
+    Args:
+        plants: Power plants to convert
+    
+    Returns:
+        One feature dict per plant, in order
+    """
+    color = FUEL_CATEGORY_COLORS.get
+    rows = [
+        (p.oris_code, p.plant_name, p.primary_fuel, p.primary_fuel_category,
+         p.nameplate_mw, p.annual_net_gen_mwh, p.longitude, p.latitude)
+        for p in plants
+    ]
+    
+    features = []
+    for oris_code, name, fuel, category, nameplate_mw, generation_mwh, lon, lat in rows:
+        renewable = _is_renewable_fuel(fuel, category)
+        features.append({
+            "type": "Feature",
+            "id": oris_code,
+            "properties": {
+                "oris_code": oris_code,
+                "plant_name": name,
+                "primary_fuel": fuel,
+                "primary_fuel_category": category,
+                "nameplate_mw": round(nameplate_mw, 1),
+                "annual_net_gen_mwh": round(generation_mwh, 0),
+                "is_renewable": renewable,
+                "is_clean": renewable,
+                "fuel_color": color(category, DEFAULT_FUEL_COLOR),
+            },
+            "geometry": {
+                "type": "Point",
+                "coordinates": [lon, lat]
+            }
+        })
+    return features
 
 
 # ============================================================================
@@ -132,6 +174,8 @@ class GridNodeCoordinates(BaseModel):
 
 class NearbyProject(BaseModel):
     """Nearby clean energy project"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     distance_km: float
     capacity_mw: int
@@ -154,6 +198,8 @@ class NearbyPowerPlant(BaseModel):
 
 class TransmissionLine(BaseModel):
     """Nearby transmission infrastructure"""
+    model_config = ConfigDict(frozen=True)
+    
     line_id: str
     distance_km: float
     voltage_kv: int  # Kilovolts (e.g., 230, 345, 500, 765)
@@ -180,14 +226,21 @@ class GridNode(BaseModel):
     reliability: float = Field(..., ge=0, le=100, description="Grid reliability/resilience score")
     
     # Optional enrichment data
-    nearby_projects: List[NearbyProject] = []
-    transmission_lines: List[TransmissionLine] = []
+    nearby_projects: Tuple[NearbyProject, ...] = ()
+    transmission_lines: Tuple[TransmissionLine, ...] = ()
     
     # Metadata
     region: Optional[str] = None  # e.g., "Pacific Northwest", "ERCOT", "PJM"
     state: Optional[str] = None
     balancing_authority: Optional[str] = None
     
+    @field_validator('region', 'state', 'balancing_authority')
+    @classmethod
+    def intern_label(cls, v: Optional[str]) -> Optional[str]:
+        # Small fixed vocabularies: share one string object per value instead
+        # of keeping a separate copy on every node
+        return sys.intern(v) if v is not None else v
+    
     def to_geojson_feature(self) -> Dict[str, Any]:
         """Convert grid node to GeoJSON feature for Mapbox visualization"""
         return {
@@ -222,8 +275,11 @@ class SitingWeights(BaseModel):
     """
     Weight allocation for siting criteria.
     
-    Must sum to exactly 1.0 for valid composite score calculation.
+    Must sum to exactly 1.0 for valid composite score calculation. Frozen,
+    since get_siting_weights() shares one instance per weight triple.
     """
+    model_config = ConfigDict(frozen=True)
+    
     weight_clean: float = Field(0.4, ge=0, le=1, description="Weight for clean generation proximity")
     weight_transmission: float = Field(0.3, ge=0, le=1, description="Weight for transmission headroom")
     weight_reliability: float = Field(0.3, ge=0, le=1, description="Weight for grid reliability")
@@ -238,10 +294,27 @@ class SitingWeights(BaseModel):
     def validate_sum(self) -> None:
         """Validate that weights sum to 1.0 (with floating-point tolerance)"""
         total = self.weight_clean + self.weight_transmission + self.weight_reliability
-        if not math.isclose(total, 1.0, rel_tol=1e-9):
+        if abs(total - 1.0) > 1e-9:
             raise ValueError(f"Weights must sum to 1.0, got {total:.10f}")
 
 
+@lru_cache(maxsize=128)
+def get_siting_weights(weight_clean: float, weight_transmission: float, weight_reliability: float) -> SitingWeights:
+    """
+    SitingWeights for a weight triple, built and sum-checked once per triple.
+    
+    The returned instance is shared between callers (SitingWeights is
+    frozen). Invalid triples raise ValueError each time (exceptions are not cached).
+    """
+    weights = SitingWeights(
+        weight_clean=weight_clean,
+        weight_transmission=weight_transmission,
+        weight_reliability=weight_reliability
+    )
+    weights.validate_sum()
+    return weights
+
+
 class DemandProfile(BaseModel):
     """Profile of the electro-intensive load being sited"""
     demand_type: Literal["data_center", "electrolyzer", "ev_hub", "hydrogen_plant", "ai_compute"] = "data_center"
@@ -327,14 +400,8 @@ class SitingRequest(BaseModel):
     demand_type: Optional[Literal["data_center", "electrolyzer", "ev_hub", "hydrogen_plant", "ai_compute"]] = None
     
     def to_weights(self) -> SitingWeights:
-        """Convert to SitingWeights model with validation"""
-        weights = SitingWeights(
-            weight_clean=self.weight_clean,
-            weight_transmission=self.weight_transmission,
-            weight_reliability=self.weight_reliability
-        )
-        weights.validate_sum()
-        return weights
+        """Convert to SitingWeights model with validation (shared per weight triple)"""
+        return get_siting_weights(self.weight_clean, self.weight_transmission, self.weight_reliability)
     
     def to_demand_profile(self) -> Optional[DemandProfile]:
         """Convert to DemandProfile if demand info provided"""
@@ -366,14 +433,8 @@ class LocationEvaluationRequest(BaseModel):
     location_name: Optional[str] = Field(None, description="Optional name for the clicked location")
     
     def to_weights(self) -> SitingWeights:
-        """Convert to SitingWeights model with validation"""
-        weights = SitingWeights(
-            weight_clean=self.weight_clean,
-            weight_transmission=self.weight_transmission,
-            weight_reliability=self.weight_reliability
-        )
-        weights.validate_sum()
-        return weights
+        """Convert to SitingWeights model with validation (shared per weight triple)"""
+        return get_siting_weights(self.weight_clean, self.weight_transmission, self.weight_reliability)
     
     def to_demand_profile(self) -> Optional[DemandProfile]:
         """Convert to DemandProfile if demand info provided"""
@@ -7,14 +7,27 @@ Provides filtering and GeoJSON conversion for map visualization.
 
 import json
 import logging
-from typing import List, Optional
+import math
+import os
+import pickle
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-from models import PowerPlant
+import numpy as np
+from models import PowerPlant, power_plant_features
 
 logger = logging.getLogger(__name__)
 
+# eGRID plant export, relative to this file
+DEFAULT_PLANTS_JSON = "../egrid2023_plants_lat_lng_fuel_power.json"
 
-def load_power_plants_from_json(json_path: str = "../egrid2023_plants_lat_lng_fuel_power.json") -> List[PowerPlant]:
+# Pickled plant list for cold starts, used when POWER_PLANTS_DISK_CACHE=1.
+# Keyed by the source JSON's path, mtime and size; modules whose edits
+# invalidate it are listed in _DISK_CACHE_SOURCES.
+POWER_PLANTS_CACHE_FILE = Path(__file__).parent / "data" / "cache" / "power_plants.pkl"
+_DISK_CACHE_SOURCES = (Path(__file__), Path(__file__).parent / "models.py")
+
+
+def load_power_plants_from_json(json_path: str = DEFAULT_PLANTS_JSON) -> List[PowerPlant]:
     """
     Load power plants from eGRID JSON file.
     
@@ -38,25 +51,29 @@ def load_power_plants_from_json(json_path: str = "../egrid2023_plants_lat_lng_fu
         with open(full_path, 'r') as f:
             raw_data = json.load(f)
         
-        # Parse and validate with Pydantic
+        # Parse and validate with Pydantic (model_validate on a dict skips
+        # the keyword-argument round trip of the constructor)
+        validate = PowerPlant.model_validate
         plants = []
         for item in raw_data:
             try:
-                # Handle NaN values in annual_net_gen_mwh
+                # Handle NaN values in annual_net_gen_mwh (json parses NaN as
+                # a float; string "nan" values are treated the same way)
                 annual_gen = item.get('annual_net_gen_mwh', 0.0)
-                if annual_gen is None or str(annual_gen).lower() == 'nan':
+                if (annual_gen is None or annual_gen != annual_gen
+                        or (isinstance(annual_gen, str) and annual_gen.lower() == 'nan')):
                     annual_gen = 0.0
                 
-                plant = PowerPlant(
-                    oris_code=item['oris_code'],
-                    plant_name=item['plant_name'],
-                    latitude=item['latitude'],
-                    longitude=item['longitude'],
-                    primary_fuel=item['primary_fuel'],
-                    primary_fuel_category=item['primary_fuel_category'],
-                    nameplate_mw=item['nameplate_mw'],
-                    annual_net_gen_mwh=float(annual_gen)
-                )
+                plant = validate({
+                    'oris_code': item['oris_code'],
+                    'plant_name': item['plant_name'],
+                    'latitude': item['latitude'],
+                    'longitude': item['longitude'],
+                    'primary_fuel': item['primary_fuel'],
+                    'primary_fuel_category': item['primary_fuel_category'],
+                    'nameplate_mw': item['nameplate_mw'],
+                    'annual_net_gen_mwh': float(annual_gen)
+                })
                 plants.append(plant)
             except (KeyError, ValueError, TypeError) as e:
                 logger.warning(f"Skipping invalid plant entry: {e}")
@@ -97,6 +114,14 @@ def filter_power_plants(
     Returns:
         Filtered list of PowerPlant objects
     """
+    table = _loaded_plant_table(plants)
+    if table is not None:
+        indices = filter_plant_indices(
+            table, fuel_category, fuel_categories, min_capacity_mw, max_capacity_mw,
+            renewable_only, clean_only
+        )
+        return [plants[i] for i in indices.tolist()]
+    
     filtered = plants
     
     # Filter by fuel category (support both single and multiple)
@@ -120,6 +145,80 @@ def filter_power_plants(
     return filtered
 
 
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """
+    Bounds of a Web Mercator (slippy map / XYZ) tile.
+    
+    Args:
+        z: Zoom level
+        x: Tile column (0 at 180°W)
+        y: Tile row (0 at the northern edge)
+    
+    Returns:
+        Tuple of (west, south, east, north) in degrees
+    """
+    n = 2 ** z
+    
+    def tile_latitude(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+    
+    return (x / n * 360.0 - 180.0, tile_latitude(y + 1), (x + 1) / n * 360.0 - 180.0, tile_latitude(y))
+
+
+def filter_plant_indices(
+    table: Dict[str, np.ndarray],
+    fuel_category: Optional[str] = None,
+    fuel_categories: Optional[List[str]] = None,
+    min_capacity_mw: float = 0,
+    max_capacity_mw: float = 10000,
+    renewable_only: bool = False,
+    clean_only: bool = False,
+    bounds: Optional[Tuple[float, float, float, float]] = None
+) -> np.ndarray:
+    """
+    Same selection as filter_power_plants(), as row indices into build_plant_table().
+    
+    Args:
+        table: Plant columns from build_plant_table()
+        fuel_category: Filter by specific fuel category (deprecated, use fuel_categories)
+        fuel_categories: Filter by multiple fuel categories (e.g., ["SOLAR", "WIND"])
+        min_capacity_mw: Minimum nameplate capacity
+        max_capacity_mw: Maximum nameplate capacity
+        renewable_only: Only include renewable sources
+        clean_only: Only include clean energy (renewable + nuclear)
+        bounds: Optional (west, south, east, north) box, e.g. from tile_bounds();
+            west/north edges are inclusive and east/south exclusive, so
+            adjacent tiles never share a plant
+    
+    Returns:
+        Ascending indices of the matching plants
+    """
+    capacity = table["nameplate_mw"]
+    mask = (capacity >= min_capacity_mw) & (capacity <= max_capacity_mw)
+    
+    # Filter by fuel category (support both single and multiple) with a
+    # per-code lookup table, so each plant costs one gather, not a set test
+    # (np.take is about twice as fast as fancy indexing with uint8 codes)
+    wanted = fuel_categories or ([fuel_category] if fuel_category else None)
+    if wanted:
+        wanted = set(wanted)
+        category_mask = np.array([c in wanted for c in table["fuel_categories"].tolist()], dtype=bool)
+        mask &= np.take(category_mask, table["fuel_category_idx"])
+    
+    if renewable_only:
+        mask &= table["is_renewable"]
+    elif clean_only:
+        mask &= table["is_clean"]
+    
+    if bounds is not None:
+        west, south, east, north = bounds
+        lon = table["longitude"]
+        lat = table["latitude"]
+        mask &= (lon >= west) & (lon < east) & (lat > south) & (lat <= north)
+    
+    return np.flatnonzero(mask)
+
+
 def get_fuel_category_stats(plants: List[PowerPlant]) -> dict:
     """
     Calculate statistics by fuel category.
@@ -128,6 +227,10 @@ def get_fuel_category_stats(plants: List[PowerPlant]) -> dict:
     Returns:
         Dictionary with counts and capacity by fuel category
     """
+    table = _loaded_plant_table(plants)
+    if table is not None:
+        return get_fuel_category_stats_from_table(table)
+    
     stats = {}
     
     for plant in plants:
@@ -152,6 +255,116 @@ def get_fuel_category_stats(plants: List[PowerPlant]) -> dict:
     return stats
 
 
+def build_plant_table(plants: List[PowerPlant]) -> Dict[str, np.ndarray]:
+    """
+    Build a Structure-of-Arrays view of power plants for vectorized stats.
+    
+    Columns are aligned with ``plants``. Fuel categories are stored as codes
+    (``fuel_category_idx``, one byte each for up to 256 categories) into
+    ``fuel_categories``, which lists each category once in order of first
+    appearance.
+    
+    Args:
+        plants: List of PowerPlant objects
+    
+    Returns:
+        Dict mapping column name to a NumPy array
+    """
+    category_codes: Dict[str, int] = {}
+    category_idx = [category_codes.setdefault(p.primary_fuel_category, len(category_codes)) for p in plants]
+    
+    return {
+        "latitude": np.array([p.latitude for p in plants], dtype=np.float64),
+        "longitude": np.array([p.longitude for p in plants], dtype=np.float64),
+        "nameplate_mw": np.array([p.nameplate_mw for p in plants], dtype=np.float64),
+        "annual_net_gen_mwh": np.array([p.annual_net_gen_mwh for p in plants], dtype=np.float64),
+        "fuel_category_idx": np.array(category_idx, dtype=np.uint8 if len(category_codes) <= 256 else np.intp),
+        "fuel_categories": np.array(list(category_codes), dtype=object),
+        "is_renewable": np.array([p.is_renewable() for p in plants], dtype=bool),
+        "is_clean": np.array([p.is_clean() for p in plants], dtype=bool),
+    }
+
+
+def get_fuel_category_stats_from_table(
+    table: Dict[str, np.ndarray],
+    indices: Optional[np.ndarray] = None
+) -> dict:
+    """
+    Same result as get_fuel_category_stats(), computed from build_plant_table().
+    
+    Per-category sums accumulate in plant order (np.bincount), and categories
+    are listed in order of first appearance, so the result matches the
+    object-based version exactly.
+    
+    Args:
+        table: Plant columns from build_plant_table()
+        indices: Rows to include, in order (default: all plants)
+    
+    Returns:
+        Dictionary with counts and capacity by fuel category
+    """
+    codes = table["fuel_category_idx"]
+    capacity_mw = table["nameplate_mw"]
+    generation_mwh = table["annual_net_gen_mwh"]
+    is_clean = table["is_clean"]
+    if indices is not None:
+        codes = codes[indices]
+        capacity_mw = capacity_mw[indices]
+        generation_mwh = generation_mwh[indices]
+        is_clean = is_clean[indices]
+    
+    n_categories = len(table["fuel_categories"])
+    counts = np.bincount(codes, minlength=n_categories)
+    capacity = np.bincount(codes, weights=capacity_mw, minlength=n_categories)
+    generation = np.bincount(codes, weights=generation_mwh, minlength=n_categories)
+    
+    # Like the object version, a category's is_clean comes from its first plant
+    first_plant = np.full(n_categories, len(codes), dtype=np.intp)
+    np.minimum.at(first_plant, codes, np.arange(len(codes)))
+    present = np.flatnonzero(counts)
+    
+    categories = table["fuel_categories"]
+    return {
+        categories[i]: {
+            "count": int(counts[i]),
+            "total_capacity_mw": round(float(capacity[i]), 1),
+            "total_generation_mwh": round(float(generation[i]), 0),
+            "is_clean": bool(is_clean[first_plant[i]])
+        }
+        for i in present[np.argsort(first_plant[present], kind="stable")].tolist()
+    }
+
+
+def geojson_metadata_from_table(table: Dict[str, np.ndarray], indices: np.ndarray) -> dict:
+    """
+    Same metadata as power_plants_to_geojson(), computed from build_plant_table().
+    
+    Args:
+        table: Plant columns from build_plant_table()
+        indices: Rows of the plants in the collection, in order
+    
+    Returns:
+        GeoJSON metadata dict
+    """
+    is_clean = table["is_clean"][indices]
+    clean_rows = indices[is_clean]
+    clean_count = len(clean_rows)
+    
+    # Python sum keeps the sequential rounding of the object version
+    total_capacity = sum(table["nameplate_mw"][clean_rows].tolist())
+    total_generation = sum(table["annual_net_gen_mwh"][clean_rows].tolist())
+    
+    return {
+        "total_plants": len(indices),
+        "clean_energy_capacity_mw": round(total_capacity, 1),
+        "clean_energy_generation_mwh": round(total_generation, 0),
+        "clean_count": clean_count,
+        "clean_percentage": round(clean_count / len(indices) * 100, 1) if len(indices) else 0,
+        "fuel_categories": get_fuel_category_stats_from_table(table, indices),
+        "note": "Only WND, SUN, WAT, GEO counted as clean energy"
+    }
+
+
 def power_plants_to_geojson(
     plants: List[PowerPlant],
     include_metadata: bool = True
@@ -167,14 +380,15 @@ def power_plants_to_geojson(
     Returns:
         GeoJSON FeatureCollection dict
     """
-    features = [plant.to_geojson_feature() for plant in plants]
-    
     geojson = {
         "type": "FeatureCollection",
-        "features": features
+        "features": power_plant_features(plants)
     }
     
-    if include_metadata:
+    table = _loaded_plant_table(plants) if include_metadata else None
+    if table is not None:
+        geojson["metadata"] = geojson_metadata_from_table(table, np.arange(len(plants)))
+    elif include_metadata:
         stats = get_fuel_category_stats(plants)
         
         # Only count clean energy in totals
@@ -202,11 +416,82 @@ def power_plants_to_geojson(
 # Global cache for loaded plants (avoid reloading file on every request)
 _cached_plants: Optional[List[PowerPlant]] = None
 
+# build_plant_table() of _cached_plants as (plants, length, table), built on
+# first use by the list-based helpers
+_cached_plant_table: Optional[Tuple[List[PowerPlant], int, Dict[str, np.ndarray]]] = None
+
+
+def _loaded_plant_table(plants: List[PowerPlant]) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Column view of plants if it is the loaded plant list, else None.
+    
+    Other lists (e.g. already filtered ones) are usually scanned once, so
+    building a table for them would cost more than the scan it replaces.
+    """
+    global _cached_plant_table
+    
+    if _cached_plants is None or plants is not _cached_plants:
+        return None
+    
+    cached = _cached_plant_table
+    if cached is not None and cached[0] is plants and cached[1] == len(plants):
+        return cached[2]
+    
+    table = build_plant_table(plants)
+    _cached_plant_table = (plants, len(plants), table)
+    return table
+
+
+def _disk_cache_key(json_path: str) -> Tuple[str, int, int]:
+    """(resolved path, mtime_ns, size) identifying one version of the plant JSON"""
+    full_path = (Path(__file__).parent / json_path).resolve()
+    st = full_path.stat()
+    return str(full_path), st.st_mtime_ns, st.st_size
+
+
+def _load_disk_cached_plants(key: Tuple[str, int, int]) -> Optional[List[PowerPlant]]:
+    """
+    Plants pickled by _save_disk_cached_plants() for this JSON version.
+    
+    Returns None when the file is missing, was written for another JSON
+    version, is older than power_plants_data.py/models.py, or fails to
+    unpickle.
+    """
+    try:
+        built_at = POWER_PLANTS_CACHE_FILE.stat().st_mtime
+        if any(src.stat().st_mtime > built_at for src in _DISK_CACHE_SOURCES):
+            logger.info("Power plant disk cache is stale, reloading from JSON")
+            return None
+        cached_key, plants = pickle.loads(POWER_PLANTS_CACHE_FILE.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to load power plant disk cache: {e}")
+        return None
+    
+    return plants if cached_key == key else None
+
+
+def _save_disk_cached_plants(key: Tuple[str, int, int], plants: List[PowerPlant]) -> None:
+    """Pickle plants for _load_disk_cached_plants(); failures are only logged"""
+    try:
+        POWER_PLANTS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrently starting workers never read a
+        # partial file
+        tmp_file = POWER_PLANTS_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(pickle.dumps((key, plants), protocol=5))
+        tmp_file.replace(POWER_PLANTS_CACHE_FILE)
+    except Exception as e:
+        logger.warning(f"Failed to save power plant disk cache: {e}")
+
 
 def get_all_power_plants(reload: bool = False) -> List[PowerPlant]:
     """
     Get all power plants (with caching).
     
+    With POWER_PLANTS_DISK_CACHE=1, the parsed list is also pickled to
+    data/cache so later processes skip JSON parsing and validation.
+    
     Args:
         reload: Force reload from file
     
@@ -216,7 +501,17 @@ def get_all_power_plants(reload: bool = False) -> List[PowerPlant]:
     global _cached_plants
     
     if _cached_plants is None or reload:
-        _cached_plants = load_power_plants_from_json()
+        if os.getenv("POWER_PLANTS_DISK_CACHE") == "1":
+            key = _disk_cache_key(DEFAULT_PLANTS_JSON)
+            plants = _load_disk_cached_plants(key)
+            if plants is None:
+                plants = load_power_plants_from_json()
+                _save_disk_cached_plants(key, plants)
+            else:
+                logger.info(f"Loaded {len(plants)} power plants from disk cache")
+            _cached_plants = plants
+        else:
+            _cached_plants = load_power_plants_from_json()
     
     return _cached_plants
 
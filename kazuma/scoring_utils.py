@@ -8,8 +8,17 @@ Uses Pythagorean distance approximation for speed and simplicity.
 """
 
 import math
-from typing import List, Tuple, Optional
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence, Tuple
 import logging
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +37,18 @@ TRANSMISSION_BULK = 300       # < 300km = bulk 500-765kV transmission
 TRANSMISSION_LONG = 500       # < 500km = long-distance HVDC/EHV lines
 # > 500km = minimal transmission value for siting
 
+# Source sets at least this large are prefiltered with a LatitudeBandIndex;
+# smaller ones are cheaper to score as one dense distance matrix
+SPATIAL_INDEX_MIN_SOURCES = 200
+
+# Below this many node × source pairs the scalar math-module scorers beat
+# the NumPy batch scorers (array dispatch overhead dominates)
+BATCH_MIN_PAIRS = 50
+
+# With numba installed, source sets at least this large are scored by the
+# compiled parallel kernels instead of the NumPy batch path
+NUMBA_MIN_SOURCES = 5000
+
 
 def pythagorean_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -62,6 +83,84 @@ def pythagorean_distance(lat1: float, lon1: float, lat2: float, lon2: float) ->
     return distance
 
 
+def pythagorean_distance_matrix(node_lats, node_lons, src_lats, src_lons) -> np.ndarray:
+    """
+    Vectorized pythagorean_distance() for every (node, source) pair.
+    
+    For more than one node, cos(avg_lat) is expanded with the angle-addition
+    identity cos(a/2 + b/2) = cos(a/2)·cos(b/2) − sin(a/2)·sin(b/2), so
+    the transcendental calls are made once per node and source instead of
+    once per pair.
+    
+    Args:
+        node_lats, node_lons: Array-like of N node coordinates (degrees)
+        src_lats, src_lons: Array-like of M source coordinates (degrees)
+    
+    Returns:
+        (N, M) array of approximate distances in kilometers
+    """
+    node_lats = np.asarray(node_lats, dtype=np.float64)[:, None]
+    node_lons = np.asarray(node_lons, dtype=np.float64)[:, None]
+    src_lats = np.asarray(src_lats, dtype=np.float64)[None, :]
+    src_lons = np.asarray(src_lons, dtype=np.float64)[None, :]
+    
+    if node_lats.shape[0] > 1:
+        node_half = np.radians(node_lats) / 2.0
+        src_half = np.radians(src_lats) / 2.0
+        cos_avg_lat = np.cos(node_half) * np.cos(src_half) - np.sin(node_half) * np.sin(src_half)
+    else:
+        # A single row has one pair per source, so the direct form is cheaper
+        cos_avg_lat = np.cos(np.radians((node_lats + src_lats) / 2.0))
+    
+    lat_diff_km = (src_lats - node_lats) * 111.0
+    lon_diff_km = (src_lons - node_lons) * 111.0 * cos_avg_lat
+    
+    return np.sqrt(lat_diff_km**2 + lon_diff_km**2)
+
+
+class LatitudeBandIndex:
+    """
+    Sources sorted by latitude, for exact radius prefiltering.
+    
+    pythagorean_distance() is never smaller than the north-south leg
+    (|lat difference| × 111 km), so every source within radius_km of a point
+    lies inside the latitude band returned by candidates().
+    """
+    
+    # Band padding in degrees (~0.1 m) so float rounding never drops an edge source
+    _BAND_MARGIN_DEG = 1e-6
+    
+    def __init__(self, latitudes: np.ndarray):
+        self.order = np.argsort(latitudes, kind="stable")
+        self.sorted_latitudes = np.asarray(latitudes)[self.order]
+    
+    def candidates(self, latitude: float, radius_km: float) -> np.ndarray:
+        """Indices (ascending, into the original arrays) of sources that may be within radius_km"""
+        half_band = radius_km / 111.0 + self._BAND_MARGIN_DEG
+        lo = np.searchsorted(self.sorted_latitudes, latitude - half_band, side="left")
+        hi = np.searchsorted(self.sorted_latitudes, latitude + half_band, side="right")
+        return np.sort(self.order[lo:hi])
+
+
+def _distance_blocks(node_lats, node_lons, src_lats, src_lons, radius_km: float):
+    """
+    Yield (node_rows, source_cols, distances) blocks covering every node/source
+    pair closer than radius_km.
+    
+    Small source sets come back as a single dense (N, M) block; larger ones are
+    prefiltered per node with a LatitudeBandIndex, giving 1-D distance rows.
+    """
+    if len(src_lats) < SPATIAL_INDEX_MIN_SOURCES:
+        yield slice(None), slice(None), pythagorean_distance_matrix(node_lats, node_lons, src_lats, src_lons)
+        return
+    
+    index = LatitudeBandIndex(src_lats)
+    for i in range(len(node_lats)):
+        cols = index.candidates(node_lats[i], radius_km)
+        distances = pythagorean_distance_matrix(node_lats[i:i + 1], node_lons[i:i + 1], src_lats[cols], src_lons[cols])
+        yield i, cols, distances[0]
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate great-circle distance between two points on Earth using Haversine formula.
@@ -110,6 +209,16 @@ def proximity_decay_factor(distance_km: float) -> float:
         return 0.0
 
 
+def proximity_decay_array(distances: np.ndarray) -> np.ndarray:
+    """Vectorized proximity_decay_factor() (same stepped decay, any array shape)"""
+    decay = np.interp(
+        distances,
+        [DISTANCE_EXCELLENT, DISTANCE_GOOD, DISTANCE_MODERATE, DISTANCE_FAIR],
+        [1.0, 0.7, 0.4, 0.2]
+    )
+    return np.where(distances < DISTANCE_FAIR, decay, 0.0)
+
+
 def transmission_decay_factor(distance_km: float, plant_capacity_mw: float) -> float:
     """
     Calculate transmission infrastructure decay factor.
@@ -190,6 +299,103 @@ def transmission_decay_factor(distance_km: float, plant_capacity_mw: float) -> f
     return max(0.0, base_factor)
 
 
+def transmission_decay_array(distances: np.ndarray, plant_capacities_mw: np.ndarray) -> np.ndarray:
+    """
+    Vectorized transmission_decay_factor().
+    
+    Args:
+        distances: (N, M) node-to-plant distances in km
+        plant_capacities_mw: (M,) nameplate capacity per plant
+    
+    Returns:
+        (N, M) array of decay factors, identical to the scalar function
+    """
+    capacity = np.broadcast_to(plant_capacities_mw, distances.shape)
+    large = capacity >= 500
+    medium = (capacity >= 100) & ~large
+    very_large = capacity >= 1000
+    
+    # Per-plant curve parameters for the steep / moderate / gentle voltage classes
+    max_range = np.where(large, TRANSMISSION_BULK, np.where(medium, TRANSMISSION_REGIONAL, TRANSMISSION_LOCAL))
+    regional_drop = np.where(large, 0.2, np.where(medium, 0.4, 0.7))
+    bulk_start = np.where(large, 0.8, np.where(medium, 0.6, 0.3))
+    bulk_drop = np.where(large, 0.3, np.where(medium, 0.4, 0.3))
+    long_start = np.where(very_large, 0.5, np.where(large, 0.2, 0.0))
+    long_drop = np.where(very_large, 0.4, np.where(large, 0.2, 0.0))
+    
+    d = distances
+    beyond_range = np.where(
+        very_large & (d < TRANSMISSION_LONG),
+        0.1 - (d - max_range) / (TRANSMISSION_LONG - max_range) * 0.1,
+        0.0
+    )
+    base_factor = np.select(
+        [d < TRANSMISSION_LOCAL, d < TRANSMISSION_REGIONAL, d < TRANSMISSION_BULK],
+        [
+            1.0,
+            1.0 - (d - TRANSMISSION_LOCAL) / (TRANSMISSION_REGIONAL - TRANSMISSION_LOCAL) * regional_drop,
+            bulk_start - (d - TRANSMISSION_REGIONAL) / (TRANSMISSION_BULK - TRANSMISSION_REGIONAL) * bulk_drop,
+        ],
+        long_start - (d - TRANSMISSION_BULK) / (TRANSMISSION_LONG - TRANSMISSION_BULK) * long_drop
+    )
+    
+    return np.where(d > max_range, beyond_range, np.maximum(0.0, base_factor))
+
+
+def _clean_gen_raw_loops(node_lats, node_lons, src_lats, src_lons, src_weights):
+    """
+    Explicit-loop clean gen raw scores and nearby capacity per node.
+    
+    Compiled with numba (parallel over nodes) when it is installed. Sums in
+    source order exactly like calculate_clean_gen_score().
+    """
+    raw_scores = np.zeros(node_lats.shape[0])
+    nearby_capacity = np.zeros(node_lats.shape[0])
+    for i in prange(node_lats.shape[0]):
+        raw = 0.0
+        nearby = 0.0
+        for j in range(src_lats.shape[0]):
+            distance = _pythagorean_distance_kernel(node_lats[i], node_lons[i], src_lats[j], src_lons[j])
+            if distance < DISTANCE_FAIR:
+                raw += src_weights[j] * _proximity_decay_kernel(distance)
+                nearby += src_weights[j]
+        raw_scores[i] = raw
+        nearby_capacity[i] = nearby
+    return raw_scores, nearby_capacity
+
+
+def _transmission_raw_loops(node_lats, node_lons, plant_lats, plant_lons, plant_mw):
+    """
+    Explicit-loop transmission raw scores per node.
+    
+    Compiled with numba (parallel over nodes) when it is installed. Sums in
+    plant order exactly like calculate_transmission_score().
+    """
+    raw_scores = np.zeros(node_lats.shape[0])
+    for i in prange(node_lats.shape[0]):
+        raw = 0.0
+        for j in range(plant_lats.shape[0]):
+            distance = _pythagorean_distance_kernel(node_lats[i], node_lons[i], plant_lats[j], plant_lons[j])
+            decay = _transmission_decay_kernel(distance, plant_mw[j])
+            if decay > 0.0:
+                raw += plant_mw[j] * decay
+        raw_scores[i] = raw
+    return raw_scores
+
+
+if HAS_NUMBA:
+    # Same scalar math as the pure-Python functions, so compiled scores match
+    _pythagorean_distance_kernel = njit(cache=True)(pythagorean_distance)
+    _proximity_decay_kernel = njit(cache=True)(proximity_decay_factor)
+    _transmission_decay_kernel = njit(cache=True)(transmission_decay_factor)
+    _clean_gen_raw_kernel = njit(parallel=True, cache=True)(_clean_gen_raw_loops)
+    _transmission_raw_kernel = njit(parallel=True, cache=True)(_transmission_raw_loops)
+else:
+    _pythagorean_distance_kernel = pythagorean_distance
+    _proximity_decay_kernel = proximity_decay_factor
+    _transmission_decay_kernel = transmission_decay_factor
+
+
 def calculate_clean_gen_score(
     node_lat: float,
     node_lon: float,
@@ -243,18 +449,42 @@ def calculate_clean_gen_score(
         if distance < DISTANCE_FAIR:
             nearby_capacity += capacity_mw * clean_multiplier
     
+    return finalize_clean_gen_score(raw_score, nearby_capacity, normalization_factor, demand_mw)
+
+
+def finalize_clean_gen_score(
+    raw_score: float,
+    nearby_capacity: float,
+    normalization_factor: float,
+    demand_mw: Optional[float] = None
+) -> float:
+    """
+    Turn a raw proximity-weighted capacity sum into a 0-100 clean gen score.
+    
+    Shared by the per-node and batch scoring paths so both normalize and
+    apply capacity adequacy identically.
+    
+    Args:
+        raw_score: Sum of capacity × clean_multiplier × proximity
+        nearby_capacity: Clean capacity within DISTANCE_FAIR (for adequacy)
+        normalization_factor: Divider to scale raw score to 0-100 range
+        demand_mw: Optional demand size in MW (for capacity adequacy scoring)
+    
+    Returns:
+        Clean generation score (0-100), rounded to 1 decimal
+    """
     # Normalize to 0-100 scale
     base_score = min(100.0, (raw_score / normalization_factor) * 100.0)
     
     # Apply capacity adequacy adjustment if demand specified
-    if demand_mw and demand_mw > 0:
+    if demand_mw is not None and demand_mw > 0:
         adequacy_factor = calculate_capacity_adequacy_factor(nearby_capacity, demand_mw)
         adjusted_score = base_score * adequacy_factor
         
         logger.debug(
-            f"Clean gen capacity adequacy: {nearby_capacity:.0f} MW available, "
-            f"{demand_mw:.0f} MW demand, factor={adequacy_factor:.2f}, "
-            f"score {base_score:.1f} → {adjusted_score:.1f}"
+            "Clean gen capacity adequacy: %.0f MW available, %.0f MW demand, "
+            "factor=%.2f, score %.1f → %.1f",
+            nearby_capacity, demand_mw, adequacy_factor, base_score, adjusted_score
         )
         
         return round(adjusted_score, 1)
@@ -262,6 +492,54 @@ def calculate_clean_gen_score(
     return round(base_score, 1)
 
 
+def calculate_clean_gen_scores_batch(
+    node_lats: np.ndarray,
+    node_lons: np.ndarray,
+    src_lats: np.ndarray,
+    src_lons: np.ndarray,
+    source_weights: np.ndarray,
+    normalization_factor: Optional[float] = None,
+    demand_mw: Optional[float] = None
+) -> Tuple[List[float], float]:
+    """
+    Vectorized calculate_clean_gen_score() for many nodes at once.
+    
+    Only sources within DISTANCE_FAIR contribute, so large source sets are
+    prefiltered per node (see _distance_blocks).
+    
+    Args:
+        node_lats, node_lons: (N,) node coordinates
+        src_lats, src_lons: (M,) source coordinates
+        source_weights: (M,) array of capacity_mw × clean_multiplier per source
+        normalization_factor: Divider to scale raw scores; if None it is
+            estimated from these nodes, as estimate_normalization_factor() does
+        demand_mw: Optional demand size in MW (for capacity adequacy scoring)
+    
+    Returns:
+        Tuple of (scores aligned with the nodes, normalization factor used)
+    """
+    if HAS_NUMBA and len(src_lats) >= NUMBA_MIN_SOURCES:
+        raw_scores, nearby_capacity = _clean_gen_raw_kernel(
+            *(np.ascontiguousarray(a, dtype=np.float64) for a in (node_lats, node_lons, src_lats, src_lons, source_weights))
+        )
+    else:
+        raw_scores = np.zeros(len(node_lats))
+        nearby_capacity = np.zeros(len(node_lats))
+        for rows, cols, distances in _distance_blocks(node_lats, node_lons, src_lats, src_lons, DISTANCE_FAIR):
+            weights = source_weights[cols]
+            raw_scores[rows] = proximity_decay_array(distances) @ weights
+            nearby_capacity[rows] = (distances < DISTANCE_FAIR) @ weights
+    
+    if normalization_factor is None:
+        normalization_factor = normalization_from_raw_scores(raw_scores.tolist())
+    
+    scores = [
+        finalize_clean_gen_score(raw, nearby, normalization_factor, demand_mw)
+        for raw, nearby in zip(raw_scores.tolist(), nearby_capacity.tolist())
+    ]
+    return scores, normalization_factor
+
+
 def calculate_capacity_adequacy_factor(available_capacity_mw: float, demand_mw: float) -> float:
     """
     Calculate capacity adequacy multiplier for clean generation scoring.
@@ -310,10 +588,90 @@ def calculate_capacity_adequacy_factor(available_capacity_mw: float, demand_mw:
         return 0.50
 
 
+# LatitudeBandIndex over the last list searched by each _nearby_candidates() caller.
+# Entries hold the list itself plus its length, so a new or resized list
+# (e.g. after a data reload) rebuilds the index.
+_nearby_index_cache: Dict[str, Tuple[Sequence, int, LatitudeBandIndex]] = {}
+
+
+def _nearby_candidates(kind: str, items: Sequence, latitude_of, latitude: float, radius_km: float) -> Sequence:
+    """
+    Items of a nearby search that may lie within radius_km, in list order.
+    
+    Lists below SPATIAL_INDEX_MIN_SOURCES are returned whole; larger ones are
+    narrowed to a latitude band using a cached LatitudeBandIndex.
+    
+    Args:
+        kind: Cache slot name (one per search function)
+        items: Sources or plants being searched
+        latitude_of: Callable returning an item's latitude
+        latitude: Search point latitude
+        radius_km: Search radius
+    
+    Returns:
+        Candidate items (a superset of the matches), preserving list order
+    """
+    if len(items) < SPATIAL_INDEX_MIN_SOURCES:
+        return items
+    
+    cached = _nearby_index_cache.get(kind)
+    if cached is None or cached[0] is not items or cached[1] != len(items):
+        index = LatitudeBandIndex(np.array([latitude_of(item) for item in items], dtype=np.float64))
+        cached = _nearby_index_cache[kind] = (items, len(items), index)
+    
+    return [items[i] for i in cached[2].candidates(latitude, radius_km).tolist()]
+
+
+# (plants, len(plants), latitudes, longitudes, LatitudeBandIndex) for the last
+# plant list searched, shared by every plant proximity search; rebuilt when the
+# list object or its length changes
+_plant_coordinate_cache: Optional[Tuple[Sequence, int, np.ndarray, np.ndarray, LatitudeBandIndex]] = None
+
+# Slack added to vectorized distance prefilters so a last-ulp difference from
+# the scalar pythagorean_distance() never drops an edge plant
+PREFILTER_MARGIN_KM = 1e-6
+
+
+def _plant_coordinates(power_plants: Sequence) -> Tuple[np.ndarray, np.ndarray, LatitudeBandIndex]:
+    """Cached latitude/longitude columns and LatitudeBandIndex for a plant list"""
+    global _plant_coordinate_cache
+    
+    cached = _plant_coordinate_cache
+    if cached is None or cached[0] is not power_plants or cached[1] != len(power_plants):
+        latitudes = np.array([p.latitude for p in power_plants], dtype=np.float64)
+        longitudes = np.array([p.longitude for p in power_plants], dtype=np.float64)
+        cached = _plant_coordinate_cache = (
+            power_plants, len(power_plants), latitudes, longitudes, LatitudeBandIndex(latitudes)
+        )
+    return cached[2], cached[3], cached[4]
+
+
+def nearby_plant_candidates(power_plants: Sequence, latitude: float, radius_km: float) -> Sequence:
+    """
+    Power plants that may lie within radius_km of a point at this latitude.
+    
+    Shares one cached LatitudeBandIndex per plant list across all plant
+    proximity searches, so point queries scan a band instead of every plant.
+    
+    Args:
+        power_plants: PowerPlant objects being searched
+        latitude: Search point latitude
+        radius_km: Search radius
+    
+    Returns:
+        Candidate plants (a superset of the matches), preserving list order
+    """
+    if len(power_plants) < SPATIAL_INDEX_MIN_SOURCES:
+        return power_plants
+    
+    _, _, index = _plant_coordinates(power_plants)
+    return [power_plants[i] for i in index.candidates(latitude, radius_km).tolist()]
+
+
 def find_nearby_sources(
     node_lat: float,
     node_lon: float,
-    energy_sources: List[Tuple[str, float, float, float, str]],
+    energy_sources: Sequence[Tuple[str, float, float, float, str]],
     max_distance_km: float = 300.0,
     limit: int = 10
 ) -> List[dict]:
@@ -331,8 +689,9 @@ def find_nearby_sources(
         List of dicts with source info and distance, sorted by distance
     """
     nearby = []
+    candidates = _nearby_candidates("sources", energy_sources, itemgetter(1), node_lat, max_distance_km)
     
-    for name, source_lat, source_lon, capacity_mw, energy_type in energy_sources:
+    for name, source_lat, source_lon, capacity_mw, energy_type in candidates:
         distance = pythagorean_distance(node_lat, node_lon, source_lat, source_lon)
         
         if distance <= max_distance_km:
@@ -379,9 +738,20 @@ def find_nearby_power_plants(
     """
     logger.debug(f"find_nearby_power_plants: lat={node_lat:.3f}, lon={node_lon:.3f}, {len(power_plants)} total plants, max_dist={max_distance_km}km, clean_only={clean_only}")
     
-    nearby = []
+    if not power_plants:
+        return []
+    
+    # Narrow to the latitude band, then to plants whose vectorized distance
+    # is within range; only those get the exact scalar distance below
+    latitudes, longitudes, index = _plant_coordinates(power_plants)
+    rows = index.candidates(node_lat, max_distance_km)
+    approx_km = pythagorean_distance_matrix((node_lat,), (node_lon,), latitudes[rows], longitudes[rows])[0]
+    rows = rows[approx_km <= max_distance_km + PREFILTER_MARGIN_KM]
     
-    for plant in power_plants:
+    nearby = []
+    for i in rows.tolist():
+        plant = power_plants[i]
+        
         # Skip non-clean plants if clean_only=True
         if clean_only and not plant.is_clean():
             continue
@@ -392,25 +762,26 @@ def find_nearby_power_plants(
         )
         
         if distance <= max_distance_km:
-            nearby.append({
-                "oris_code": plant.oris_code,
-                "plant_name": plant.plant_name,
-                "distance_km": round(distance, 1),
-                "primary_fuel": plant.primary_fuel,
-                "primary_fuel_category": plant.primary_fuel_category,
-                "nameplate_mw": round(plant.nameplate_mw, 1),
-                "is_clean": plant.is_clean(),
-                "latitude": plant.latitude,
-                "longitude": plant.longitude
-            })
+            nearby.append((round(distance, 1), plant))
     
     logger.debug(f"Found {len(nearby)} plants within {max_distance_km}km before sorting/limiting")
     
-    # Sort by distance (closest first)
-    nearby.sort(key=lambda x: x["distance_km"])
-    
-    # Return top N
-    result = nearby[:limit]
+    # Sort by distance (closest first), then build dicts for the top N only
+    nearby.sort(key=itemgetter(0))
+    result = [
+        {
+            "oris_code": plant.oris_code,
+            "plant_name": plant.plant_name,
+            "distance_km": distance_km,
+            "primary_fuel": plant.primary_fuel,
+            "primary_fuel_category": plant.primary_fuel_category,
+            "nameplate_mw": round(plant.nameplate_mw, 1),
+            "is_clean": plant.is_clean(),
+            "latitude": plant.latitude,
+            "longitude": plant.longitude
+        }
+        for distance_km, plant in nearby[:limit]
+    ]
     logger.debug(f"Returning {len(result)} plants after limit={limit}")
     
     return result
@@ -453,7 +824,9 @@ def calculate_transmission_score(
     plants_considered = 0
     total_capacity_nearby = 0.0
     
-    for plant in power_plants:
+    # Plants beyond TRANSMISSION_LONG have zero decay, so only the
+    # latitude band around the node can contribute
+    for plant in nearby_plant_candidates(power_plants, node_lat, TRANSMISSION_LONG):
         # Calculate distance
         distance = pythagorean_distance(
             node_lat, node_lon,
@@ -486,6 +859,51 @@ def calculate_transmission_score(
     return round(score, 1)
 
 
+def calculate_transmission_scores_batch(
+    node_lats: np.ndarray,
+    node_lons: np.ndarray,
+    plant_lats: np.ndarray,
+    plant_lons: np.ndarray,
+    plant_capacities_mw: np.ndarray,
+    normalization_factor: Optional[float] = None
+) -> Tuple[List[float], float]:
+    """
+    Vectorized calculate_transmission_score() for many nodes at once.
+    
+    Plants contribute nothing beyond TRANSMISSION_LONG, so large plant sets
+    are prefiltered per node (see _distance_blocks).
+    
+    Args:
+        node_lats, node_lons: (N,) node coordinates
+        plant_lats, plant_lons: (M,) plant coordinates
+        plant_capacities_mw: (M,) nameplate capacity per plant
+        normalization_factor: Divider to scale raw scores; if None it is estimated
+            from these nodes, as estimate_transmission_normalization_factor() does
+    
+    Returns:
+        Tuple of (scores aligned with the nodes, normalization factor used)
+    """
+    if HAS_NUMBA and len(plant_lats) >= NUMBA_MIN_SOURCES:
+        raw_scores = _transmission_raw_kernel(
+            *(np.ascontiguousarray(a, dtype=np.float64) for a in (node_lats, node_lons, plant_lats, plant_lons, plant_capacities_mw))
+        )
+    else:
+        raw_scores = np.zeros(len(node_lats))
+        for rows, cols, distances in _distance_blocks(node_lats, node_lons, plant_lats, plant_lons, TRANSMISSION_LONG):
+            capacities = plant_capacities_mw[cols]
+            raw_scores[rows] = transmission_decay_array(distances, capacities) @ capacities
+    raw_scores = raw_scores.tolist()
+    
+    if normalization_factor is None:
+        normalization_factor = transmission_normalization_from_raw_scores(raw_scores)
+    
+    scores = [
+        round(min(100.0, (raw / normalization_factor) * 100.0), 1)
+        for raw in raw_scores
+    ]
+    return scores, normalization_factor
+
+
 def estimate_normalization_factor(
     all_nodes: List[Tuple[float, float]],
     energy_sources: List[Tuple[float, float, float, float]],
@@ -528,8 +946,19 @@ def estimate_normalization_factor(
         
         raw_scores.append(raw_score)
     
+    return normalization_from_raw_scores(raw_scores)
+
+
+def normalization_from_raw_scores(raw_scores: List[float]) -> float:
+    """
+    Pick the clean gen normalization factor from per-node raw scores.
+    
+    Uses the 90th percentile (see estimate_normalization_factor), falling back
+    to the maximum when that is below 1.0.
+    """
+    raw_scores = sorted(raw_scores)
+    
     # Sort and find 90th percentile
-    raw_scores.sort()
     percentile_90_idx = int(len(raw_scores) * 0.9)
     normalization_factor = raw_scores[percentile_90_idx]
     
@@ -568,7 +997,9 @@ def estimate_transmission_normalization_factor(
     for node_lat, node_lon in all_nodes:
         raw_score = 0.0
         
-        for plant in power_plants:
+        # Plants beyond TRANSMISSION_LONG decay to 0 (same prefilter as
+        # calculate_transmission_score); skipping them leaves the sum unchanged
+        for plant in nearby_plant_candidates(power_plants, node_lat, TRANSMISSION_LONG):
             distance = pythagorean_distance(
                 node_lat, node_lon,
                 plant.latitude, plant.longitude
@@ -579,8 +1010,19 @@ def estimate_transmission_normalization_factor(
         
         raw_scores.append(raw_score)
     
+    return transmission_normalization_from_raw_scores(raw_scores)
+
+
+def transmission_normalization_from_raw_scores(raw_scores: List[float]) -> float:
+    """
+    Pick the transmission normalization factor from per-node raw scores.
+    
+    Uses the 90th percentile (see estimate_transmission_normalization_factor),
+    falling back to the maximum, then 5000, when that is below 1000.
+    """
+    raw_scores = sorted(raw_scores)
+    
     # Sort and find 90th percentile
-    raw_scores.sort()
     percentile_90_idx = int(len(raw_scores) * 0.9)
     normalization_factor = raw_scores[percentile_90_idx]
     
@@ -599,6 +1041,91 @@ def estimate_transmission_normalization_factor(
     return normalization_factor
 
 
+# Normalization factors memoized by node coordinates plus dataset list
+# identity and length, as (dataset, factor) so the list stays alive and its
+# id cannot be reused. The version is part of every key;
+# invalidate_normalization_cache() bumps it when the source datasets are
+# reloaded.
+_NORMALIZATION_CACHE_SIZE = 16
+_normalization_cache: Dict[tuple, Tuple[Sequence, float]] = {}
+_normalization_cache_version = 0
+
+
+def invalidate_normalization_cache() -> None:
+    """Drop memoized normalization factors (call after reloading source data)"""
+    global _normalization_cache_version
+    
+    _normalization_cache_version += 1
+    _normalization_cache.clear()
+
+
+def _memoized_normalization(key: tuple, dataset: Sequence, estimate) -> float:
+    """Return the cached factor for key and dataset, computing it with estimate() on a miss"""
+    key = (_normalization_cache_version,) + key + (id(dataset), len(dataset))
+    
+    cached = _normalization_cache.get(key)
+    if cached is not None and cached[0] is dataset:
+        return cached[1]
+    
+    factor = estimate()
+    if len(_normalization_cache) >= _NORMALIZATION_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order); scoring runs in
+        # worker threads, so another thread may have evicted it already
+        _normalization_cache.pop(next(iter(_normalization_cache), None), None)
+    _normalization_cache[key] = (dataset, factor)
+    
+    return factor
+
+
+def cached_normalization_factor(
+    all_nodes: List[Tuple[float, float]],
+    energy_sources: List[Tuple[float, float, float, float]]
+) -> float:
+    """
+    estimate_normalization_factor(), memoized by nodes and source list.
+    
+    Sources are keyed by list identity and length, so callers should pass
+    the same list object for the same data, and a reload that changes a
+    list in place must call invalidate_normalization_cache().
+    
+    Args:
+        all_nodes: List of (lat, lon) tuples for all grid nodes
+        energy_sources: List of (lat, lon, capacity_mw, clean_multiplier) tuples
+    
+    Returns:
+        Normalization factor to use in calculate_clean_gen_score()
+    """
+    return _memoized_normalization(
+        ("clean", tuple(all_nodes)),
+        energy_sources,
+        lambda: estimate_normalization_factor(all_nodes, energy_sources)
+    )
+
+
+def cached_transmission_normalization_factor(
+    all_nodes: List[Tuple[float, float]],
+    power_plants: List  # List of PowerPlant objects
+) -> float:
+    """
+    estimate_transmission_normalization_factor(), memoized by nodes and plant list.
+    
+    Plants are keyed by list identity and length, so a reload that changes
+    plant data in place must call invalidate_normalization_cache().
+    
+    Args:
+        all_nodes: List of (lat, lon) tuples for all grid nodes
+        power_plants: List of PowerPlant objects (all fuel types)
+    
+    Returns:
+        Normalization factor to use in calculate_transmission_score()
+    """
+    return _memoized_normalization(
+        ("transmission", tuple(all_nodes)),
+        power_plants,
+        lambda: estimate_transmission_normalization_factor(all_nodes, power_plants)
+    )
+
+
 # Example usage and testing
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
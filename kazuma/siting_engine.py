@@ -4,20 +4,126 @@ Siting Engine for Smart Grid Optimization
 Calculates composite siting scores using weighted criteria and ranks alternative locations.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import logging
 import math
+import numpy as np
 from models import (
     GridNode,
     SitingWeights,
     ScoreBreakdown,
     SiteEvaluation,
     DemandProfile,
-    ScenarioComparison
+    ScenarioComparison,
+    NearbyPowerPlant
+)
+from grid_data import generate_mock_grid_nodes
+from scoring_utils import (
+    calculate_clean_gen_score,
+    calculate_transmission_score,
+    cached_normalization_factor,
+    cached_transmission_normalization_factor,
+    find_nearby_power_plants,
+    nearby_plant_candidates,
+    pythagorean_distance
 )
 
 logger = logging.getLogger(__name__)
 
+# (nodes, len(nodes), metrics) for the last node list scored by
+# composite_scores(); rankings reuse the (N, 3) metric matrix until the list
+# object or its length changes
+_node_metrics_cache: Optional[Tuple[Sequence[GridNode], int, np.ndarray]] = None
+
+
+def _node_metrics(nodes: Sequence[GridNode]) -> np.ndarray:
+    """
+    (N, 3) float64 matrix of clean_gen, transmission_headroom and reliability.
+    
+    Args:
+        nodes: Grid nodes to tabulate
+    
+    Returns:
+        Metric matrix aligned with nodes (shared; do not modify)
+    """
+    global _node_metrics_cache
+    
+    cached = _node_metrics_cache
+    if cached is not None and cached[0] is nodes and cached[1] == len(nodes):
+        return cached[2]
+    
+    metrics = np.array(
+        [(n.clean_gen, n.transmission_headroom, n.reliability) for n in nodes],
+        dtype=np.float64
+    ).reshape(-1, 3)
+    _node_metrics_cache = (nodes, len(nodes), metrics)
+    return metrics
+
+
+# (plants, len(plants), sources) for the last plant list passed to
+# _clean_plant_sources(); the shared list also keys the memoized clean gen
+# normalization factor
+_clean_source_cache: Optional[Tuple[Sequence, int, List[Tuple[float, float, float, float]]]] = None
+
+
+def _clean_plant_sources(power_plants: Sequence) -> List[Tuple[float, float, float, float]]:
+    """
+    (lat, lon, capacity, clean multiplier) for the clean plants in a list.
+    
+    Args:
+        power_plants: Power plant objects (all fuel types)
+    
+    Returns:
+        Source tuples for calculate_clean_gen_score() (shared; do not modify)
+    """
+    global _clean_source_cache
+    
+    cached = _clean_source_cache
+    if cached is not None and cached[0] is power_plants and cached[1] == len(power_plants):
+        return cached[2]
+    
+    # All clean plants get multiplier of 1.0 (equal weighting)
+    sources = [
+        (p.latitude, p.longitude, p.nameplate_mw, 1.0)
+        for p in power_plants
+        if p.is_clean()
+    ]
+    _clean_source_cache = (power_plants, len(power_plants), sources)
+    return sources
+
+
+def _descending_order(scores: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of scores from highest to lowest, ties in index order.
+    
+    With a limit below len(scores) only the top entries are sorted: a
+    partition finds the limit-th highest score, and every index scoring at
+    least that much is stable-sorted, so boundary ties resolve exactly as
+    in a full stable sort.
+    
+    Args:
+        scores: 1-D score array
+        limit: Only return the first N indices (N >= 0)
+    
+    Returns:
+        Index array of length min(limit, len(scores))
+    
+    Raises:
+        ValueError: If limit is negative
+    """
+    if limit is not None and limit < 0:
+        raise ValueError(f"limit must be non-negative, got {limit}")
+    
+    negated = -scores
+    if limit is None or limit >= len(scores):
+        return np.argsort(negated, kind="stable")[:limit]
+    if limit == 0:
+        return np.empty(0, dtype=np.intp)
+    
+    threshold = np.partition(negated, limit - 1)[limit - 1]
+    candidates = np.flatnonzero(negated <= threshold)
+    return candidates[np.argsort(negated[candidates], kind="stable")][:limit]
+
 
 class SitingEngine:
     """Engine for calculating optimal siting scores and comparing locations"""
@@ -113,9 +219,6 @@ class SitingEngine:
         Returns:
             ScoreBreakdown with calculated scores and composite
         """
-        from scoring_utils import calculate_clean_gen_score, find_nearby_sources, estimate_normalization_factor
-        from grid_data import generate_mock_grid_nodes
-        
         # Validate weights
         weights.validate_sum()
         
@@ -125,26 +228,15 @@ class SitingEngine:
         # Calculate clean_gen score from clean energy power plants
         clean_gen_score = 0.0
         if power_plants:
-            # Filter for clean energy plants only (renewable + nuclear)
-            clean_plants = [p for p in power_plants if p.is_clean()]
-            
-            # Prepare clean plant data (lat, lon, capacity, clean multiplier)
-            # All clean plants get multiplier of 1.0 (equal weighting)
-            source_data = [
-                (
-                    p.latitude,
-                    p.longitude,
-                    p.nameplate_mw,
-                    1.0  # All clean energy equally valued
-                )
-                for p in clean_plants
-            ]
+            # Clean energy plants only, as (lat, lon, capacity, clean
+            # multiplier) tuples; cached per plant list
+            source_data = _clean_plant_sources(power_plants)
             
             if source_data:
                 # Estimate normalization factor (use existing nodes as reference)
                 grid_nodes = generate_mock_grid_nodes()
                 node_coords = [(n.coordinates.latitude, n.coordinates.longitude) for n in grid_nodes]
-                normalization_factor = estimate_normalization_factor(node_coords, source_data)
+                normalization_factor = cached_normalization_factor(node_coords, source_data)
                 
                 # Calculate clean gen score
                 clean_gen_score = calculate_clean_gen_score(
@@ -158,12 +250,10 @@ class SitingEngine:
         # Calculate transmission_headroom score based on ALL nearby power plants
         transmission_score = 0.0
         if power_plants:
-            from scoring_utils import calculate_transmission_score, estimate_transmission_normalization_factor
-            
             # Estimate normalization factor (use existing nodes as reference)
             grid_nodes = generate_mock_grid_nodes()
             node_coords = [(n.coordinates.latitude, n.coordinates.longitude) for n in grid_nodes]
-            trans_normalization = estimate_transmission_normalization_factor(node_coords, power_plants)
+            trans_normalization = cached_transmission_normalization_factor(node_coords, power_plants)
             
             # Calculate transmission score using ALL power plants
             transmission_score = calculate_transmission_score(
@@ -228,16 +318,13 @@ class SitingEngine:
         Returns:
             Transmission score 0-100
         """
-        from scoring_utils import calculate_transmission_score, estimate_transmission_normalization_factor
-        from grid_data import generate_mock_grid_nodes
-        
         if not power_plants:
             return 50.0  # Neutral default for no data
         
         # Estimate normalization factor using all grid nodes as reference
         grid_nodes = generate_mock_grid_nodes()
         node_coords = [(n.coordinates.latitude, n.coordinates.longitude) for n in grid_nodes]
-        normalization_factor = estimate_transmission_normalization_factor(node_coords, power_plants)
+        normalization_factor = cached_transmission_normalization_factor(node_coords, power_plants)
         
         # Calculate transmission score using comprehensive algorithm
         score = calculate_transmission_score(
@@ -265,14 +352,12 @@ class SitingEngine:
         
         Returns score 0-100
         """
-        from scoring_utils import pythagorean_distance
-        
         if not power_plants:
             return 50.0  # Default moderate score
         
         # Find plants within 200km (reliability zone)
         nearby_plants = []
-        for plant in power_plants:
+        for plant in nearby_plant_candidates(power_plants, latitude, 200):
             distance = pythagorean_distance(
                 latitude, longitude,
                 plant.latitude, plant.longitude
@@ -311,7 +396,7 @@ class SitingEngine:
         node: GridNode,
         weights: Optional[SitingWeights] = None,
         demand_profile: Optional[DemandProfile] = None,
-        all_nodes: Optional[List[GridNode]] = None,
+        all_nodes: Optional[Sequence[GridNode]] = None,
         power_plants: Optional[List] = None
     ) -> SiteEvaluation:
         """
@@ -377,31 +462,63 @@ class SitingEngine:
         
         return evaluation
     
-    def rank_sites(
+    def composite_scores(
         self,
-        nodes: List[GridNode],
+        nodes: Sequence[GridNode],
         weights: SitingWeights
+    ) -> List[float]:
+        """
+        Composite scores for many nodes in one vectorized pass.
+        
+        Matches calculate_composite_score(node, weights).composite_score for
+        every node (same operation order, Python rounding), without building
+        a ScoreBreakdown per node.
+        
+        Args:
+            nodes: Grid nodes to score
+            weights: Siting criteria weights
+        
+        Returns:
+            Rounded composite scores aligned with nodes
+        """
+        weights.validate_sum()
+        
+        metrics = _node_metrics(nodes)
+        composite = (
+            metrics[:, 0] * weights.weight_clean
+            + metrics[:, 1] * weights.weight_transmission
+            + metrics[:, 2] * weights.weight_reliability
+        )
+        return [round(score, 1) for score in composite.tolist()]
+    
+    def rank_sites(
+        self,
+        nodes: Sequence[GridNode],
+        weights: SitingWeights,
+        limit: Optional[int] = None
     ) -> List[Tuple[GridNode, float]]:
         """
-        Rank all sites by composite score.
+        Rank sites by composite score.
         
         Args:
             nodes: List of grid nodes to rank
             weights: Siting criteria weights
+            limit: Only return the top N sites
         
         Returns:
-            List of (node, score) tuples sorted by score descending
-        """
-        scored_nodes = []
+            List of (node, score) tuples sorted by score descending; ties keep
+            their order in nodes
         
-        for node in nodes:
-            breakdown = self.calculate_composite_score(node, weights)
-            scored_nodes.append((node, breakdown.composite_score))
+        Raises:
+            ValueError: If limit is negative
+        """
+        scores = self.composite_scores(nodes, weights)
         
-        # Sort by score descending
-        scored_nodes.sort(key=lambda x: x[1], reverse=True)
+        # Sort by score descending, keeping ties in node order like a stable
+        # reverse sort; with a limit only the top of the ranking is sorted
+        order = _descending_order(np.array(scores, dtype=np.float64), limit)
         
-        return scored_nodes
+        return [(nodes[i], scores[i]) for i in order.tolist()]
     
     def compare_scenarios(
         self,
@@ -421,19 +538,19 @@ class SitingEngine:
         if not evaluations:
             raise ValueError("Must provide at least one evaluation")
         
-        # Find best scoring site
-        best_eval = max(evaluations, key=lambda e: e.score_breakdown.composite_score)
-        best_score = best_eval.score_breakdown.composite_score
-        best_site_id = best_eval.site.id
-        
-        # Calculate score range
-        scores = [e.score_breakdown.composite_score for e in evaluations]
-        score_range = (min(scores), max(scores))
+        # Pull the composite scores once; argmax picks the first best site,
+        # like max()
+        scores = np.array(
+            [e.score_breakdown.composite_score for e in evaluations], dtype=np.float64
+        )
+        best_index = int(scores.argmax())
+        best_site_id = evaluations[best_index].site.id
+        score_range = (float(scores.min()), float(scores[best_index]))
         
         # Calculate deltas from best
+        deltas = (scores - scores[best_index]).tolist()
         score_deltas = {
-            e.site.id: round(e.score_breakdown.composite_score - best_score, 1)
-            for e in evaluations
+            e.site.id: round(delta, 1) for e, delta in zip(evaluations, deltas)
         }
         
         return ScenarioComparison(
@@ -447,12 +564,11 @@ class SitingEngine:
     def _calculate_percentile(
         self,
         node: GridNode,
-        all_nodes: List[GridNode],
+        all_nodes: Sequence[GridNode],
         weights: SitingWeights
     ) -> float:
         """Calculate what percentile this node ranks in (0-100)"""
-        ranked = self.rank_sites(all_nodes, weights)
-        scores = [score for _, score in ranked]
+        scores = self.composite_scores(all_nodes, weights)
         
         node_breakdown = self.calculate_composite_score(node, weights)
         node_score = node_breakdown.composite_score
@@ -468,7 +584,7 @@ class SitingEngine:
     def _find_alternatives(
         self,
         reference_node: GridNode,
-        all_nodes: List[GridNode],
+        all_nodes: Sequence[GridNode],
         weights: SitingWeights,
         limit: int = 5
     ) -> List[Dict[str, Any]]:
@@ -477,8 +593,8 @@ class SitingEngine:
         
         Excludes the reference node itself and returns top N by score.
         """
-        # Rank all nodes
-        ranked = self.rank_sites(all_nodes, weights)
+        # Rank the top nodes (one extra in case the reference is among them)
+        ranked = self.rank_sites(all_nodes, weights, limit=limit + 1)
         
         # Filter out reference node
         alternatives = [
@@ -580,9 +696,6 @@ class SitingEngine:
         Returns:
             List of NearbyPowerPlant objects
         """
-        from scoring_utils import find_nearby_power_plants
-        from models import NearbyPowerPlant
-        
         logger.info(f"_find_nearby_power_plants called: lat={latitude:.3f}, lon={longitude:.3f}, plants={len(power_plants) if power_plants else 0}, max_dist={max_distance_km}")
         
         # Get nearby plants using scoring utility
@@ -610,8 +723,6 @@ class SitingEngine:
 
 # Example usage and testing
 if __name__ == "__main__":
-    from grid_data import generate_mock_grid_nodes
-    
     # Initialize engine
     engine = SitingEngine()
     